@@ -1,7 +1,10 @@
 from .modules import combinators as cb
 from .modules import functions as fn
 from .modules import generators as gn
+from .modules import grids as gd
 from .modules import operators as op
+from .modules import profiling as pf
 from .modules import regex as rx
+from .modules import search as gs
 from .modules import sequences as sq
 from .modules import textual as tt
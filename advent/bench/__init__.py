@@ -0,0 +1,85 @@
+import collections
+import gc
+import time
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any, Callable, NamedTuple
+
+__all__ = [
+    'Case',
+    'measure',
+    'run',
+    'compare',
+]
+
+class Case(NamedTuple):
+    module: str
+    name: str
+    setup: Callable[[int], Any]
+    advent: Callable[[Any], Any]
+    baseline: Callable[[Any], Any] | None = None
+
+    @property
+    def key(self) -> str:
+        return f'{self.module}.{self.name}'
+
+def measure(fn: Callable[[Any], Any], data: Any, repeat: int = 3) -> tuple[float, int]:
+    """Return best wall time in seconds out of `repeat` runs of `fn(data)` and its peak traced memory in bytes"""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        _drain(fn(data))
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _drain(fn(data))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+def run(cases: list[Case], sizes: list[int], repeat: int = 3, log: Callable[[str], Any] | None = None) -> list[dict[str, Any]]:
+    """Measure every case at every input size against its hand-written baseline"""
+    results = []
+    for case in cases:
+        for size in sizes:
+            data = case.setup(size)
+            seconds, peak = measure(case.advent, data, repeat)
+            result = {
+                'case': case.key,
+                'size': size,
+                'seconds': seconds,
+                'throughput': size / seconds if seconds else None,
+                'peak_bytes': peak,
+            }
+            if case.baseline is not None:
+                baseline_seconds, baseline_peak = measure(case.baseline, data, repeat)
+                result['baseline_seconds'] = baseline_seconds
+                result['baseline_peak_bytes'] = baseline_peak
+                result['slowdown'] = seconds / baseline_seconds if baseline_seconds else None
+            results.append(result)
+            if log is not None:
+                log(_format(result))
+    return results
+
+def compare(previous: list[dict[str, Any]], current: list[dict[str, Any]], threshold: float = 1.2) -> list[str]:
+    """Return descriptions of cases that got slower than `threshold` times their `previous` timing"""
+    before = {(result['case'], result['size']): result['seconds'] for result in previous}
+    regressions = []
+    for result in current:
+        old = before.get((result['case'], result['size']))
+        if old and result['seconds'] > old * threshold:
+            regressions.append(f"{result['case']} [{result['size']}]: {old:.6f}s -> {result['seconds']:.6f}s ({result['seconds'] / old:.2f}x)")
+    return regressions
+
+def _drain(result: Any) -> None:
+    if isinstance(result, Iterator):
+        collections.deque(result, maxlen=0)
+
+def _format(result: dict[str, Any]) -> str:
+    line = f"{result['case']:<36} {result['size']:>10} {result['seconds']:>12.6f}s {result['peak_bytes']:>12}B"
+    if result.get('slowdown') is not None:
+        line += f" {result['slowdown']:>8.2f}x baseline"
+    return line
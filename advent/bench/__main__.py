@@ -0,0 +1,41 @@
+import argparse
+import json
+import platform
+import re
+import sys
+
+from . import compare, run
+from .cases import CASES
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m advent.bench', description='Benchmark advent combinators against hand-written loops')
+    parser.add_argument('--sizes', type=lambda s: int(float(s)), nargs='+', default=[1_000, 10_000, 100_000], help='input sizes, e.g. 1e3 1e5 1e7')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timed runs per measurement, the best is kept')
+    parser.add_argument('--only', default='', help='regular expression selecting cases by module.name')
+    parser.add_argument('--output', help='path of JSON file to write results to')
+    parser.add_argument('--compare', help='path of JSON file with previous results to check for regressions')
+    parser.add_argument('--threshold', type=float, default=1.2, help='slowdown ratio reported as regression')
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if re.search(args.only, case.key)]
+    results = run(cases, args.sizes, args.repeat, log=print)
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': args.sizes,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            previous = json.load(file)['results']
+        regressions = compare(previous, results, args.threshold)
+        for line in regressions:
+            print(f'REGRESSION {line}')
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
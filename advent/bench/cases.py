@@ -0,0 +1,378 @@
+import atexit
+import builtins
+import collections
+import functools
+import heapq
+import importlib.util
+import itertools
+import math
+import operator
+import os
+import random
+import re
+import tempfile
+from typing import Any
+
+from .. import gn, gs, op, rx, sq, tt
+from ..modules.grids import Grid
+from . import Case
+
+__all__ = [
+    'CASES',
+]
+
+def _ints(n: int) -> list[int]:
+    rng = random.Random(n)
+    return [rng.randint(-1000, 1000) for _ in builtins.range(n)]
+
+def _positive(n: int) -> list[int]:
+    rng = random.Random(n)
+    return [rng.randint(1, 1000) for _ in builtins.range(n)]
+
+def _words(n: int) -> list[str]:
+    rng = random.Random(n)
+    return [''.join(rng.choice('abcdeXYZ 0123') for _ in builtins.range(8)) for _ in builtins.range(n)]
+
+def _text(n: int) -> str:
+    rng = random.Random(n)
+    return ''.join(rng.choice('abc def 123 -45\n') for _ in builtins.range(n))
+
+def _periodic(n: int) -> list[int]:
+    return [i % (n // 2 + 1) for i in builtins.range(n)]
+
+def _baseline_cycle(data: list) -> tuple[int, int] | None:
+    seen = {}
+    for i, x in builtins.enumerate(data):
+        if x in seen:
+            return seen[x], i - seen[x]
+        seen[x] = i
+    return None
+
+def _baseline_iterate(n: int) -> Any:
+    def states():
+        state = 0
+        while True:
+            yield state
+            state = state + 1
+    return itertools.islice(states(), n)
+
+def _pool(n: int, size: int) -> list[int]:
+    """Return pool of elements whose `size`-tuples number roughly `n`"""
+    k = size
+    while math.perm(k + 1, size) <= n:
+        k += 1
+    return list(builtins.range(k))
+
+def _file(content: str) -> str:
+    fd, path = tempfile.mkstemp(prefix='advent-bench-', suffix='.txt')
+    with os.fdopen(fd, 'w', encoding='utf-8') as file:
+        file.write(content)
+    atexit.register(os.remove, path)
+    return path
+
+def _read(path: str, mode: str = 'r') -> Any:
+    with open(path, mode) as file:
+        return file.read()
+
+def _file_lines(n: int) -> str:
+    return _file('\n'.join(map(str, _ints(n))) + '\n')
+
+def _calories(n: int) -> str:
+    """Return path of Calorie Counting (Advent of Code 2022 day 1) input with `n` numbers"""
+    rng = random.Random(n)
+    numbers = [str(rng.randint(1000, 60000)) for _ in builtins.range(n)]
+    groups, i = [], 0
+    while i < n:
+        size = rng.randint(1, 14)
+        groups.append('\n'.join(numbers[i:i + size]))
+        i += size
+    return _file('\n\n'.join(groups))
+
+def _maze(n: int) -> tuple[Grid, Any]:
+    """Return square grid of about `n` cells with random walls and function listing open neighbours of a cell"""
+    rng = random.Random(n)
+    side = max(math.isqrt(n), 2)
+    grid = Grid.from_text('\n'.join(''.join(rng.choice('....#') for _ in builtins.range(side)) for _ in builtins.range(side)))
+    grid[0] = grid[1] = grid[side] = ord('.')
+    cells, neighbours = grid.cells, grid.neighbours
+    return grid, lambda i: [j for j in neighbours(i) if cells[j] != 35]
+
+def _baseline_bfs(maze: tuple[Grid, Any]) -> list[tuple[int, int]]:
+    grid, passages = maze
+    seen, queue, visited = {0}, collections.deque([(0, 0)]), []
+    while queue:
+        state, distance = queue.popleft()
+        visited.append((state, distance))
+        for neighbour in passages(state):
+            if neighbour not in seen:
+                seen.add(neighbour)
+                queue.append((neighbour, distance + 1))
+    return visited
+
+def _baseline_dijkstra(maze: tuple[Grid, Any]) -> dict[int, int]:
+    grid, passages = maze
+    best, heap = {0: 0}, [(0, 0)]
+    while heap:
+        distance, state = heapq.heappop(heap)
+        if distance > best[state]:
+            continue
+        for neighbour in passages(state):
+            if neighbour not in best or distance + 1 < best[neighbour]:
+                best[neighbour] = distance + 1
+                heapq.heappush(heap, (distance + 1, neighbour))
+    return best
+
+def _baseline_windows(data: list, size: int):
+    return (tuple(data[i:i + size]) for i in builtins.range(len(data) - size + 1))
+
+def _baseline_calories(path: str) -> int:
+    content = _read(path)
+    biggest = 0
+    for chunk in content.split('\n\n'):
+        total = 0
+        for line in chunk.split('\n'):
+            total += int(line)
+        if total > biggest:
+            biggest = total
+    return biggest
+
+_even = lambda x: x % 2 == 0
+
+SEQUENCES = [
+    Case('sequences', 'map', _ints, sq.map(op.inc), lambda d: [x + 1 for x in d]),
+    Case('sequences', 'pmap', _ints, sq.pmap(abs, chunksize=4096), lambda d: [builtins.abs(x) for x in d]),
+    Case('sequences', 'tmap', _ints, sq.tmap(abs, chunksize=4096), lambda d: [builtins.abs(x) for x in d]),
+    Case('sequences', 'filter', _ints, sq.filter(op.even), lambda d: [x for x in d if x % 2 == 0]),
+    Case('sequences', 'filter_not', _ints, sq.filter_not(op.even), lambda d: [x for x in d if x % 2 != 0]),
+    Case('sequences', 'partition', _ints, sq.partition(3), lambda d: [tuple(d[i:i + 3]) for i in builtins.range(0, len(d) - 2, 3)]),
+    Case('sequences', 'padded_partition', _ints, sq.padded_partition(3), lambda d: [tuple(d[i:i + 3]) for i in builtins.range(0, len(d), 3)]),
+    Case('sequences', 'split_every', _ints, sq.split_every(3), lambda d: [tuple(d[i:i + 3]) for i in builtins.range(0, len(d), 3)]),
+    Case('sequences', 'group_by', _ints, sq.group_by(op.mod.right(10)), lambda d: functools.reduce(lambda g, x: g[x % 10].append(x) or g, d, collections.defaultdict(list))),
+    Case('sequences', 'aggregate_by', _ints, sq.aggregate_by(op.mod.right(10), {'count': len, 'total': sum}), lambda d: functools.reduce(lambda g, x: g.update({x % 10: (g[x % 10][0] + 1, g[x % 10][1] + x)}) or g, d, collections.defaultdict(lambda: (0, 0)))),
+    Case('sequences', 'frequencies', _ints, sq.frequencies(), collections.Counter),
+    Case('sequences', 'take', _ints, sq.take(100), lambda d: d[:100]),
+    Case('sequences', 'take_every', _ints, sq.take_every(3), lambda d: d[2::3]),
+    Case('sequences', 'take_while', _positive, sq.take_while(op.gt.right(0)), lambda d: [x for x in d if x > 0]),
+    Case('sequences', 'drop', _ints, sq.drop(100), lambda d: d[100:]),
+    Case('sequences', 'drop_every', _ints, sq.drop_every(3), lambda d: [x for i, x in builtins.enumerate(d, 1) if i % 3]),
+    Case('sequences', 'drop_while', _positive, sq.drop_while(op.gt.right(0)), lambda d: [x for x in d if x <= 0]),
+    Case('sequences', 'compress', _ints, sq.compress(itertools.cycle([True, False])), lambda d: d[::2]),
+    Case('sequences', 'distinct', _ints, sq.distinct(), lambda d: list(dict.fromkeys(d))),
+    Case('sequences', 'distinct_bitmap', _positive, sq.distinct(1001), lambda d: list(dict.fromkeys(d))),
+    Case('sequences', 'distinct_bloom', _positive, sq.distinct(capacity=1000), lambda d: list(dict.fromkeys(d))),
+    Case('sequences', 'count_distinct', _ints, sq.count_distinct(), lambda d: len(set(d))),
+    Case('sequences', 'count_distinct_hll', _ints, sq.count_distinct(precision=12), lambda d: len(set(d))),
+    Case('sequences', 'union', _ints, sq.union(builtins.range(0, 2000, 3)), lambda d: list(dict.fromkeys(itertools.chain(d, builtins.range(0, 2000, 3))))),
+    Case('sequences', 'intersect', _ints, sq.intersect(builtins.range(0, 2000, 3)), lambda d: (lambda common: [x for x in dict.fromkeys(d) if x in common])(set(builtins.range(0, 2000, 3)))),
+    Case('sequences', 'difference', _ints, sq.difference(builtins.range(0, 2000, 3)), lambda d: (lambda excluded: [x for x in dict.fromkeys(d) if x not in excluded])(set(builtins.range(0, 2000, 3)))),
+    Case('sequences', 'sort_by', _ints, sq.sort_by(), sorted),
+    Case('sequences', 'sort_with', _ints, sq.sort_with(op.lt), sorted),
+    Case('sequences', 'top_k', _ints, sq.top_k(3), lambda d: sorted(d, reverse=True)[:3]),
+    Case('sequences', 'bottom_k', _ints, sq.bottom_k(3), lambda d: sorted(d)[:3]),
+    Case('sequences', 'nth_smallest', _ints, sq.nth_smallest(100), lambda d: sorted(d)[100]),
+    Case('sequences', 'merge_sorted', lambda n: [sorted(_ints(n)[i::4]) for i in builtins.range(4)], sq.merge_sorted(), lambda d: sorted(itertools.chain.from_iterable(d))),
+    Case('sequences', 'reverse', _ints, sq.reverse(), lambda d: d[::-1]),
+    Case('sequences', 'cycle', _ints, lambda d: itertools.islice(sq.cycle()(d), 2 * len(d)), lambda d: d + d),
+    Case('sequences', 'enumerate', _ints, sq.enumerate(), lambda d: [(i, x) for i, x in builtins.enumerate(d)]),
+    Case('sequences', 'reduce', _ints, sq.reduce(op.add), builtins.sum),
+    Case('sequences', 'scan', _ints, sq.scan(op.add), lambda d: list(itertools.accumulate(d))),
+    Case('sequences', 'prefixes', lambda n: _ints(math.isqrt(n)), sq.prefixes(), lambda d: [tuple(d[:i]) for i in builtins.range(1, len(d) + 1)]),
+    Case('sequences', 'suffixes', lambda n: _ints(math.isqrt(n)), sq.suffixes(), lambda d: [tuple(d[i:]) for i in builtins.range(len(d))]),
+    Case('sequences', 'replicate', _ints, lambda d: sq.replicate([1, 2] * (len(d) // 2))(d), lambda d: [x for i, x in builtins.enumerate(d) for _ in builtins.range(1 + i % 2)]),
+    Case('sequences', 'contains', _ints, sq.contains(5000), lambda d: 5000 in d),
+    Case('sequences', 'contains_if', _ints, sq.contains_if(op.gt.right(5000)), lambda d: builtins.any(x > 5000 for x in d)),
+    Case('sequences', 'count', _ints, sq.count(0), lambda d: d.count(0)),
+    Case('sequences', 'count_if', _ints, sq.count_if(op.even), lambda d: builtins.sum(1 for x in d if x % 2 == 0)),
+    Case('sequences', 'index', _ints, sq.index(5000), lambda d: d.index(5000) if 5000 in d else -1),
+    Case('sequences', 'index_if', _ints, sq.index_if(op.gt.right(5000)), lambda d: next((i for i, x in builtins.enumerate(d) if x > 5000), -1)),
+    Case('sequences', 'indices', _ints, sq.indices(0), lambda d: [i for i, x in builtins.enumerate(d) if x == 0]),
+    Case('sequences', 'indices_if', _ints, sq.indices_if(op.even), lambda d: [i for i, x in builtins.enumerate(d) if x % 2 == 0]),
+    Case('sequences', 'sum', _ints, sq.sum(), builtins.sum),
+    Case('sequences', 'product', lambda n: [1, -1] * (n // 2), sq.product(), math.prod),
+    Case('sequences', 'min', _ints, sq.min(), builtins.min),
+    Case('sequences', 'max', _ints, sq.max(), builtins.max),
+    Case('sequences', 'all', _positive, sq.all(), builtins.all),
+    Case('sequences', 'any', lambda n: [0] * n, sq.any(), builtins.any),
+    Case('sequences', 'none', lambda n: [0] * n, sq.none(), lambda d: not builtins.any(d)),
+    Case('sequences', 'first', _ints, lambda d: sq.first()(iter(d)), lambda d: next(iter(d))),
+    Case('sequences', 'last', _ints, lambda d: sq.last()(iter(d)), lambda d: collections.deque(d, maxlen=1).pop()),
+    Case('sequences', 'pick', _ints, sq.pick(-1), lambda d: d[-1]),
+    Case('sequences', 'find_cycle', _periodic, sq.find_cycle(), _baseline_cycle),
+    Case('sequences', 'nth_state', _periodic, sq.nth_state(10 ** 9), lambda d: (lambda s, p: d[s + (10 ** 9 - s) % p])(*_baseline_cycle(d))),
+    Case('sequences', 'head', _ints, sq.head(), lambda d: d[0]),
+    Case('sequences', 'tail', _ints, sq.tail(), lambda d: d[1:]),
+    Case('sequences', 'edges', _ints, sq.edges(), lambda d: (d[0], d[-1])),
+    Case('sequences', 'tally', _ints, lambda d: sq.tally()(iter(d)), lambda d: builtins.sum(1 for _ in d)),
+    Case('sequences', 'sliding', _ints, sq.sliding(3), lambda d: list(_baseline_windows(d, 3))),
+    Case('sequences', 'sliding_map', _ints, sq.sliding_map(3, builtins.sum), lambda d: [builtins.sum(w) for w in _baseline_windows(d, 3)]),
+    Case('sequences', 'sliding_filter', _ints, sq.sliding_filter(3, _even), lambda d: [[x for x in w if x % 2 == 0] for w in _baseline_windows(d, 3)]),
+    Case('sequences', 'sliding_filter_not', _ints, sq.sliding_filter_not(3, _even), lambda d: [[x for x in w if x % 2] for w in _baseline_windows(d, 3)]),
+    Case('sequences', 'sliding_reduce', _ints, sq.sliding_reduce(3, op.add), lambda d: [builtins.sum(w) for w in _baseline_windows(d, 3)]),
+    Case('sequences', 'sliding_scan', _ints, sq.sliding_scan(3, op.add), lambda d: [list(itertools.accumulate(w)) for w in _baseline_windows(d, 3)]),
+    Case('sequences', 'sliding_sum', _ints, sq.sliding_sum(100), lambda d: [builtins.sum(w) for w in _baseline_windows(d, 100)]),
+    Case('sequences', 'sliding_product', _positive, sq.sliding_product(3), lambda d: [math.prod(w) for w in _baseline_windows(d, 3)]),
+    Case('sequences', 'sliding_count', _ints, sq.sliding_count(100, _even), lambda d: [builtins.sum(1 for x in w if x % 2 == 0) for w in _baseline_windows(d, 100)]),
+    Case('sequences', 'sliding_min', _ints, sq.sliding_min(100), lambda d: [builtins.min(w) for w in _baseline_windows(d, 100)]),
+    Case('sequences', 'sliding_max', _ints, sq.sliding_max(100), lambda d: [builtins.max(w) for w in _baseline_windows(d, 100)]),
+    Case('sequences', 'sliding_distinct', _ints, sq.sliding_distinct(100), lambda d: [len(set(w)) for w in _baseline_windows(d, 100)]),
+    Case('sequences', 'permutations', lambda n: _pool(n, 2), sq.permutations(2), lambda d: [(a, b) for a in d for b in d if a != b]),
+    Case('sequences', 'combinations', lambda n: _pool(2 * n, 2), sq.combinations(2), lambda d: [(a, b) for i, a in builtins.enumerate(d) for b in d[i + 1:]]),
+    Case('sequences', 'combinations_pruned', lambda n: _pool(2 * n, 2), sq.combinations(2, prune=lambda c: c[0] % 2), lambda d: [(a, b) for i, a in builtins.enumerate(d) if a % 2 == 0 for b in d[i + 1:]]),
+    Case('sequences', 'product_of', lambda n: [builtins.range(math.isqrt(n))] * 2, sq.product_of(), lambda d: [(a, b) for a in d[0] for b in d[1]]),
+    Case('sequences', 'subsets', lambda n: builtins.range(n.bit_length()), sq.subsets(), lambda d: [c for k in builtins.range(len(d) + 1) for c in itertools.combinations(d, k)]),
+    Case('sequences', 'unrank_combination', lambda n: builtins.range(n), sq.unrank_combination(10 ** 6, 3), lambda d: next(itertools.islice(itertools.combinations(d, 3), 10 ** 6, None), None)),
+    *([Case('sequences', 'to_array', _ints, sq.to_array(), list)] if importlib.util.find_spec('numpy') else []),
+    Case('sequences', 'fuse', _ints, sq.fuse(sq.map(op.abs) | sq.filter(op.even) | sq.sum()), lambda d: builtins.sum(builtins.abs(x) for x in d if x % 2 == 0)),
+]
+
+TEXTUAL = [
+    Case('textual', 'join', _words, tt.join(','), ','.join),
+    Case('textual', 'trim', _words, sq.map(tt.trim()), lambda d: [s.strip() for s in d]),
+    Case('textual', 'trim_left', _words, sq.map(tt.trim_left()), lambda d: [s.lstrip() for s in d]),
+    Case('textual', 'trim_right', _words, sq.map(tt.trim_right()), lambda d: [s.rstrip() for s in d]),
+    Case('textual', 'split', _text, tt.split(), str.split),
+    Case('textual', 'split_by', _text, tt.split_by('\n'), lambda s: s.split('\n')),
+    Case('textual', 'replace', _text, tt.replace('abc', 'x'), lambda s: s.replace('abc', 'x')),
+    Case('textual', 'substring', _words, sq.map(tt.substring(2, 3)), lambda d: [s[2:5] for s in d]),
+    Case('textual', 'contains', _words, sq.map(tt.contains('ab')), lambda d: ['ab' in s for s in d]),
+    Case('textual', 'starts_with', _words, sq.map(tt.starts_with('a')), lambda d: [s.startswith('a') for s in d]),
+    Case('textual', 'ends_with', _words, sq.map(tt.ends_with('a')), lambda d: [s.endswith('a') for s in d]),
+    Case('textual', 'is_space', _words, sq.map(tt.is_space()), lambda d: [s.isspace() for s in d]),
+    Case('textual', 'is_alnum', _words, sq.map(tt.is_alnum()), lambda d: [s.isalnum() for s in d]),
+    Case('textual', 'is_alpha', _words, sq.map(tt.is_alpha()), lambda d: [s.isalpha() for s in d]),
+    Case('textual', 'is_upper', _words, sq.map(tt.is_upper()), lambda d: [s.isupper() for s in d]),
+    Case('textual', 'is_lower', _words, sq.map(tt.is_lower()), lambda d: [s.islower() for s in d]),
+    Case('textual', 'is_digit', _words, sq.map(tt.is_digit()), lambda d: [s.isdigit() for s in d]),
+    Case('textual', 'is_ascii', _words, sq.map(tt.is_ascii()), lambda d: [s.isascii() for s in d]),
+    Case('textual', 'ints', _text, tt.ints(), lambda s: [int(x) for x in re.findall(r'-?\d+', s)]),
+    Case('textual', 'ints_per_line', _text, tt.ints_per_line(), lambda s: [[int(x) for x in re.findall(r'-?\d+', line)] for line in s.splitlines()]),
+]
+
+REGEX = [
+    Case('regex', 'split', _words, sq.map(rx.split(r'\s+')), lambda d: [re.split(r'\s+', s) for s in d]),
+    Case('regex', 'replace', _words, sq.map(rx.replace(r'\d', '#')), lambda d: [re.sub(r'\d', '#', s) for s in d]),
+    Case('regex', 'find_all', _words, sq.map(rx.find_all(r'\d+')), lambda d: [re.findall(r'\d+', s) for s in d]),
+    Case('regex', 'find_first', _words, sq.map(rx.find_first(r'\d+')), lambda d: [(m := re.search(r'\d+', s)) and m.group(0) for s in d]),
+    Case('regex', 'find_last', _words, sq.map(rx.find_last(r'\d+')), lambda d: [(m := re.findall(r'\d+', s)) and m[-1] for s in d]),
+]
+
+_UNARY_OPERATORS = {
+    'logic_not': operator.not_,
+    'bit_not': operator.invert,
+    'plus': operator.pos,
+    'minus': operator.neg,
+    'inc': lambda a: a + 1,
+    'dec': lambda a: a - 1,
+    'abs': builtins.abs,
+    'sign': lambda a: (a > 0) - (a < 0),
+    'floor': math.floor,
+    'ceil': math.ceil,
+    'even': lambda a: a % 2 == 0,
+    'odd': lambda a: a % 2 != 0,
+}
+
+_BINARY_OPERATORS = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'lt': operator.lt,
+    'le': operator.le,
+    'gt': operator.gt,
+    'ge': operator.ge,
+    'logic_or': lambda a, b: a or b,
+    'logic_and': lambda a, b: a and b,
+    'logic_xor': lambda a, b: bool(a) != bool(b),
+    'bit_or': operator.or_,
+    'bit_and': operator.and_,
+    'bit_xor': operator.xor,
+    'bit_lsh': lambda a, b: a << (b & 7),
+    'bit_rsh': operator.rshift,
+    'add': operator.add,
+    'sub': operator.sub,
+    'mul': operator.mul,
+    'div': operator.truediv,
+    'idiv': operator.floordiv,
+    'mod': operator.mod,
+    'pow': lambda a, b: a ** (b & 3),
+    'diff': lambda a, b: builtins.abs(a - b),
+    'min': builtins.min,
+    'max': builtins.max,
+    'lcm': math.lcm,
+    'gcd': math.gcd,
+}
+
+def _unary_case(name: str) -> Case:
+    fn, baseline = getattr(op, name), _UNARY_OPERATORS[name]
+    return Case('operators', name, _positive, lambda d: builtins.map(fn, d), lambda d: [baseline(x) for x in d])
+
+def _binary_case(name: str) -> Case:
+    fn, baseline = getattr(op, name), _BINARY_OPERATORS[name]
+    if name in ('bit_lsh', 'pow'):
+        fn = fn.right(3)
+        return Case('operators', name, _positive, lambda d: builtins.map(fn, d), lambda d: [baseline(x, 3) for x in d])
+    return Case('operators', name, _positive, lambda d: builtins.map(fn, d, reversed(d)), lambda d: [baseline(a, b) for a, b in zip(d, reversed(d))])
+
+OPERATORS = [_unary_case(name) for name in _UNARY_OPERATORS] + [_binary_case(name) for name in _BINARY_OPERATORS]
+
+def _read_lines_baseline(path: str) -> list[str]:
+    return _read(path).splitlines()
+
+GENERATORS = [
+    Case('generators', 'iterate', _ints, lambda d: gn.iterate(d)(), iter),
+    Case('generators', 'iterate_fn', lambda n: n, lambda n: itertools.islice(gn.iterate_fn(lambda x: x + 1, 0)(), n), _baseline_iterate),
+    Case('generators', 'range', lambda n: n, lambda n: gn.range(0, n)(), lambda n: builtins.range(0, n)),
+    Case('generators', 'irange', lambda n: n, lambda n: gn.irange(1, n)(), lambda n: builtins.range(1, n + 1)),
+    Case('generators', 'infinite_range', lambda n: n, lambda n: itertools.islice(gn.infinite_range()(), n), lambda n: builtins.range(n)),
+    Case('generators', 'read_file', _file_lines, lambda path: gn.read_file(path)(), lambda path: _read(path)),
+    Case('generators', 'read_files', lambda n: [_file_lines(n // 16) for _ in builtins.range(16)], lambda paths: gn.read_files(paths)(), lambda paths: {path: _read(path) for path in paths}),
+    Case('generators', 'read_file_lines', _file_lines, lambda path: gn.read_file_lines(path)(), _read_lines_baseline),
+    Case('generators', 'stream_file_lines', _file_lines, lambda path: gn.stream_file_lines(path)(), _read_lines_baseline),
+    Case('generators', 'stream_file_records', _calories, lambda path: gn.stream_file_records(path)(), lambda path: _read(path).split('\n\n')),
+    Case('generators', 'map_file', _file_lines, lambda path: gn.map_file(path)(), lambda path: _read(path, 'rb')),
+    Case('generators', 'map_file_lines', _file_lines, lambda path: gn.map_file_lines(path)(), lambda path: _read(path, 'rb').splitlines()),
+    Case('generators', 'map_file_records', _calories, lambda path: gn.map_file_records(path)(), lambda path: _read(path, 'rb').split(b'\n\n')),
+    Case('generators', 'map_file_chunks', _file_lines, lambda path: gn.map_file_chunks(path, 8)(), lambda path: (lambda b: [b[i:i + 8] for i in builtins.range(0, len(b), 8)])(_read(path, 'rb'))),
+]
+
+def _calorie_counting(path: str) -> Any:
+    solver = (
+        gn.read_file(path)
+        | tt.split_by('\n\n')
+        | sq.map(
+            tt.split_by('\n')
+            | sq.map(int)
+            | sq.sum()
+        )
+        | sq.max()
+    )
+    return solver()
+
+_calorie_record = sq.fuse(
+    tt.split_by('\n')
+    | sq.map(int)
+    | sq.sum()
+)
+
+def _calorie_counting_fused(path: str) -> Any:
+    solver = (
+        gn.read_file(path)
+        | tt.split_by('\n\n')
+        | sq.map(_calorie_record)
+        | sq.max()
+    )
+    return solver()
+
+PIPELINES = [
+    Case('pipelines', 'calorie_counting', _calories, _calorie_counting, _baseline_calories),
+    Case('pipelines', 'calorie_counting_fused', _calories, _calorie_counting_fused, _baseline_calories),
+    Case('pipelines', 'parse_numbers', _text, rx.find_all(r'-?\d+') | sq.map(int) | sq.sum(), lambda s: builtins.sum(int(x) for x in re.findall(r'-?\d+', s))),
+    Case('pipelines', 'parse_numbers_ints', _text, tt.ints() | sq.sum(), lambda s: builtins.sum(int(x) for x in re.findall(r'-?\d+', s))),
+]
+
+SEARCH = [
+    Case('search', 'bfs', _maze, lambda m: gs.bfs(m[1])(0), _baseline_bfs),
+    Case('search', 'bfs_bitmap', _maze, lambda m: gs.bfs(m[1], size=len(m[0]))(0), _baseline_bfs),
+    Case('search', 'dijkstra', _maze, lambda m: gs.dijkstra(m[1], cost=lambda a, b: 1)(0), _baseline_dijkstra),
+    Case('search', 'flood_fill', _maze, lambda m: gs.flood_fill(m[1], size=len(m[0]))(0), lambda m: [state for state, _ in _baseline_bfs(m)]),
+]
+
+CASES = SEQUENCES + TEXTUAL + REGEX + OPERATORS + GENERATORS + SEARCH + PIPELINES
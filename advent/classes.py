@@ -1,69 +1,411 @@
 from __future__ import annotations
 
-from typing import Any, Callable, TypeAlias
+import functools
+import inspect
+import math
+import sys
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from typing import Any, Callable, NamedTuple, TypeAlias
 
 __all__ = [
     'NullaryFn',
     'UnaryFn',
     'BinaryFn',
     'AnyFn',
+    'Pipeline',
+    'Cache',
+    'LazySequence',
+    'BloomFilter',
+    'HyperLogLog',
+    'Outcome',
+    'stage',
 ]
 
+def stage(factory: Callable[..., AnyFn]) -> Callable[..., AnyFn]:
+    """Record the factory and arguments that built each returned function as its `spec`"""
+    @functools.wraps(factory)
+    def __inner(*args: Any, **kwargs: Any) -> AnyFn:
+        fn = factory(*args, **kwargs)
+        fn.spec = (__inner, args, kwargs)
+        return fn
+    return __inner
+
 class NullaryFn:
-    __slots__ = ('fn',)
+    __slots__ = ('fn', 'spec')
 
     def __init__(self, fn: Callable[[], Any]) -> None:
         self.fn = fn
+        self.spec = None
 
     def __or__(self, other: UnaryFn | Callable[[Any], Any]) -> NullaryFn:
-        return NullaryFn(lambda: other(self()))
+        return NullaryFn(Pipeline(_stages(self) + _stages(other)))
 
     def __call__(self) -> Any:
         return self.fn()
 
+    async def arun(self) -> Any:
+        """Run stages awaiting each awaitable result before passing it on"""
+        return await _arun(self, ())
+
+    @property
+    def stages(self) -> tuple[AnyFn, ...]:
+        return _stages(self)
+
+    def __reduce__(self) -> tuple:
+        return _reduce(self)
+
     def __repr__(self) -> str:
-        return f"NullaryFn({self.fn!r})"
+        return f"NullaryFn({_describe(self)})"
 
 class UnaryFn:
-    __slots__ = ('fn',)
+    __slots__ = ('fn', 'spec')
 
     def __init__(self, fn: Callable[[Any], Any]) -> None:
         self.fn = fn
+        self.spec = None
 
     def __or__(self, other: UnaryFn | Callable[[Any], Any]) -> UnaryFn:
-        return UnaryFn(lambda arg: other(self(arg)))
+        return UnaryFn(Pipeline(_stages(self) + _stages(other)))
 
     def __call__(self, arg: Any) -> Any:
         return self.fn(arg)
 
+    async def arun(self, arg: Any) -> Any:
+        """Run stages awaiting each awaitable result before passing it on"""
+        return await _arun(self, (arg,))
+
+    @stage
     def bind(self, rhs: Any) -> NullaryFn:
         return NullaryFn(lambda: self(rhs))
 
+    @property
+    def stages(self) -> tuple[AnyFn, ...]:
+        return _stages(self)
+
+    def __reduce__(self) -> tuple:
+        return _reduce(self)
+
     def __repr__(self) -> str:
-        return f"UnaryFn({self.fn!r})"
+        return f"UnaryFn({_describe(self)})"
 
 class BinaryFn:
-    __slots__ = ('fn',)
+    __slots__ = ('fn', 'spec')
 
     def __init__(self, fn: Callable[[Any, Any], Any]) -> None:
         self.fn = fn
+        self.spec = None
 
     def __or__(self, other: UnaryFn | Callable[[Any], Any]) -> BinaryFn:
-        return BinaryFn(lambda lhs, rhs: other(self(lhs, rhs)))
+        return BinaryFn(Pipeline(_stages(self) + _stages(other)))
 
     def __call__(self, lhs: Any, rhs: Any) -> Any:
         return self.fn(lhs, rhs)
 
+    async def arun(self, lhs: Any, rhs: Any) -> Any:
+        """Run stages awaiting each awaitable result before passing it on"""
+        return await _arun(self, (lhs, rhs))
+
+    @stage
     def left(self, lhs: Any) -> UnaryFn:
         return UnaryFn(lambda arg: self(lhs, arg))
 
+    @stage
     def right(self, rhs: Any) -> UnaryFn:
         return UnaryFn(lambda arg: self(arg, rhs))
 
+    @stage
     def flip(self) -> BinaryFn:
         return BinaryFn(lambda lhs, rhs: self(rhs, lhs))
 
+    @property
+    def stages(self) -> tuple[AnyFn, ...]:
+        return _stages(self)
+
+    def __reduce__(self) -> tuple:
+        return _reduce(self)
+
     def __repr__(self) -> str:
-        return f"BinaryFn({self.fn!r})"
+        return f"BinaryFn({_describe(self)})"
 
 AnyFn: TypeAlias = NullaryFn | UnaryFn | BinaryFn
+
+class Pipeline:
+    __slots__ = ('stages', '_head', '_tail')
+
+    def __init__(self, stages: tuple[AnyFn, ...]) -> None:
+        self.stages = stages
+        self._head = stages[0].fn
+        self._tail = tuple(item.fn for item in stages[1:])
+
+    def __call__(self, *args: Any) -> Any:
+        result = self._head(*args)
+        for fn in self._tail:
+            result = fn(result)
+        return result
+
+    def __reduce__(self) -> tuple:
+        return Pipeline, (self.stages,)
+
+    def __repr__(self) -> str:
+        return f"Pipeline({' | '.join(map(repr, self.stages))})"
+
+def _stages(fn: AnyFn | Callable[..., Any]) -> tuple[AnyFn, ...]:
+    """Return flat stage list of `fn`, wrapping plain callables as single unary stage"""
+    if not isinstance(fn, (NullaryFn, UnaryFn, BinaryFn)):
+        return (UnaryFn(fn),)
+    if isinstance(fn.fn, Pipeline):
+        return fn.fn.stages
+    return (fn,)
+
+async def _arun(fn: AnyFn, args: tuple) -> Any:
+    """Run stages of `fn` with `args` awaiting awaitable results (e.g. of async sources or `acollect`) between stages"""
+    head, *tail = _stages(fn)
+    result = head.fn(*args)
+    for item in tail:
+        if inspect.isawaitable(result):
+            result = await result
+        result = item.fn(result)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+class Cache:
+    __slots__ = ('maxsize', 'maxbytes', 'policy', 'sizeof', 'hits', 'misses', 'evictions', 'nbytes', '_entries', '_sizes', '_counts', '_buckets', '_min_count')
+
+    def __init__(self, maxsize: int | None = 128, maxbytes: int | None = None, policy: str = 'lru', sizeof: Callable[[Any], int] = sys.getsizeof) -> None:
+        if policy not in ('lru', 'lfu'):
+            raise ValueError(f'Unsupported cache policy {policy!r}')
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.policy = policy
+        self.sizeof = sizeof
+        self.clear()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.policy == 'lru':
+            self._entries.move_to_end(key)
+        else:
+            self._touch(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        size = self.sizeof(value) if self.maxbytes is not None else 0
+        if self.maxsize == 0 or (self.maxbytes is not None and size > self.maxbytes):
+            return
+        if key in self._entries:
+            self.nbytes -= self._sizes.get(key, 0)
+            self._entries[key] = value
+            if self.policy == 'lru':
+                self._entries.move_to_end(key)
+            else:
+                self._touch(key)
+        else:
+            while self._entries and self._full(size):
+                self._evict()
+            self._entries[key] = value
+            if self.policy == 'lfu':
+                self._counts[key] = 1
+                self._buckets.setdefault(1, OrderedDict())[key] = None
+                self._min_count = 1
+        if self.maxbytes is not None:
+            self._sizes[key] = size
+            self.nbytes += size
+            while len(self._entries) > 1 and self.nbytes > self.maxbytes:
+                self._evict()
+
+    def clear(self) -> None:
+        self.hits = self.misses = self.evictions = self.nbytes = 0
+        self._entries = OrderedDict() if self.policy == 'lru' else {}
+        self._sizes = {}
+        self._counts = {}
+        self._buckets = {}
+        self._min_count = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'nbytes': self.nbytes,
+        }
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"Cache(policy={self.policy!r}, maxsize={self.maxsize!r}, maxbytes={self.maxbytes!r}, {self.stats()})"
+
+    def _full(self, size: int) -> bool:
+        if self.maxsize is not None and len(self._entries) >= self.maxsize:
+            return True
+        return self.maxbytes is not None and self.nbytes + size > self.maxbytes
+
+    def _touch(self, key: Any) -> None:
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def _evict(self) -> None:
+        if self.policy == 'lru':
+            key, _ = self._entries.popitem(last=False)
+        else:
+            bucket = self._buckets[self._min_count]
+            key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+                self._min_count = min(self._buckets, default=0)
+            del self._counts[key]
+            del self._entries[key]
+        self.nbytes -= self._sizes.pop(key, 0)
+        self.evictions += 1
+
+class LazySequence(Sequence):
+    __slots__ = ('source', 'indices', 'mappers')
+
+    def __init__(self, source: Sequence, indices: range | None = None, mappers: tuple[Callable[[Any], Any], ...] = ()) -> None:
+        self.source = source
+        self.indices = range(len(source)) if indices is None else indices
+        self.mappers = mappers
+
+    def map(self, mapper: Callable[[Any], Any]) -> LazySequence:
+        """Return sequence of the same length with `mapper` applied to elements when accessed"""
+        return LazySequence(self.source, self.indices, self.mappers + (mapper,))
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            return LazySequence(self.source, self.indices[key], self.mappers)
+        value = self.source[self.indices[key]]
+        for mapper in self.mappers:
+            value = mapper(value)
+        return value
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.indices == range(len(self.source)):
+            it = iter(self.source)
+        else:
+            it = map(self.source.__getitem__, self.indices)
+        for mapper in self.mappers:
+            it = map(mapper, it)
+        return it
+
+    def __reversed__(self) -> Iterator[Any]:
+        return iter(self[::-1])
+
+    def __repr__(self) -> str:
+        return f"LazySequence(length={len(self)}, mappers={len(self.mappers)})"
+
+class BloomFilter:
+    __slots__ = ('size', 'hashes', 'bits')
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        if not 0 < error_rate < 1:
+            raise ValueError(f'Unsupported error rate {error_rate!r}')
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / max(capacity, 1) * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, item: Any) -> bool:
+        """Add `item` returning whether it was (certainly) not present before"""
+        bits, added = self.bits, False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        return added
+
+    def __contains__(self, item: Any) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __repr__(self) -> str:
+        return f"BloomFilter(size={self.size}, hashes={self.hashes})"
+
+    def _positions(self, item: Any) -> list[int]:
+        """Return bit positions of `item` derived from two halves of its mixed hash by double hashing"""
+        value, size = _mix(item), self.size
+        first, second = value & 0xFFFFFFFF, (value >> 32) | 1
+        return [(first + i * second) % size for i in range(self.hashes)]
+
+class HyperLogLog:
+    __slots__ = ('precision', 'registers')
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError(f'Unsupported precision {precision!r}')
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, item: Any) -> None:
+        value = _mix(item)
+        index, rest = value >> (64 - self.precision), value & ((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def __len__(self) -> int:
+        """Return estimated number of distinct items added (standard error about 1.04 / sqrt(2 ** precision))"""
+        m = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+    def __repr__(self) -> str:
+        return f"HyperLogLog(precision={self.precision}, estimate={len(self)})"
+
+class Outcome(NamedTuple):
+    key: Any
+    result: Any
+    error: BaseException | None
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+def _mix(item: Any) -> int:
+    """Return 64-bit hash of `item` with bits spread by splitmix64 finalizer (plain `hash` of ints is the int itself)"""
+    value = (hash(item) + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return value ^ (value >> 31)
+
+def _build(factory: Callable[..., AnyFn], args: tuple, kwargs: dict[str, Any]) -> AnyFn:
+    return factory(*args, **kwargs)
+
+def _reduce(fn: AnyFn) -> tuple:
+    """Return pickle recipe of `fn`, rebuilding it from its factory and arguments when known"""
+    if fn.spec is not None:
+        return _build, fn.spec
+    return type(fn), (fn.fn,)
+
+def _describe(fn: AnyFn) -> str:
+    """Return `fn` described as factory call with arguments when known"""
+    if fn.spec is None:
+        return repr(fn.fn)
+    factory, args, kwargs = fn.spec
+    if (describe := getattr(factory, 'describe', None)) is not None:
+        return describe(*args, **kwargs)
+    arguments = [*map(repr, args), *(f'{key}={value!r}' for key, value in kwargs.items())]
+    return f"{factory.__module__.rpartition('.')[2]}.{factory.__qualname__}({', '.join(arguments)})"
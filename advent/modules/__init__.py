@@ -1,12 +1,15 @@
-from . import (combinators, functions, generators, operators,
-               regex, sequences, textual)
+from . import (combinators, functions, generators, grids, operators,
+               profiling, regex, search, sequences, textual)
 
 __all__ = [
     'combinators',
     'functions',
     'generators',
+    'grids',
     'operators',
+    'profiling',
     'regex',
+    'search',
     'sequences',
     'textual',
 ]
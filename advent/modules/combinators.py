@@ -1,12 +1,13 @@
 import inspect
 from typing import Any, Callable
 
-from ..classes import AnyFn, BinaryFn, NullaryFn, UnaryFn
+from ..classes import AnyFn, BinaryFn, NullaryFn, UnaryFn, stage
 
 __all__ = [
     'train'
 ]
 
+@stage
 def train(f: Callable[..., Any], g: Callable[[Any, Any], Any], h: Callable[..., Any]) -> AnyFn:
     """Apply results of `f` and `h` to the binary function `g`"""
     f_arity = len(inspect.signature(f).parameters)
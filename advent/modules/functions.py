@@ -1,32 +1,218 @@
+import contextlib
+import glob
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import sqlite3
+import types
+from pathlib import Path
 from typing import Any, Callable
 
-from ..classes import UnaryFn
+from ..classes import AnyFn, BinaryFn, Cache, NullaryFn, Pipeline, UnaryFn, stage
+from . import generators
 
 __all__ = [
     'to',
     'apply',
     'partial',
     'identity',
+    'memoize',
+    'persist',
 ]
 
+@stage
 def to(T: type) -> UnaryFn:
     """Return a unary function that casts its argument to `T`"""
     return UnaryFn(T)
 
+@stage
 def apply(fn: Callable[[Any], Any]) -> UnaryFn:
     """Return a unary function that applies `fn` to its argument"""
     def __inner(arg: Any) -> Any:
         return fn(arg)
     return UnaryFn(__inner)
 
+@stage
 def partial(fn: Callable[[Any], Any], projector: Callable[[Any], Any]) -> UnaryFn:
     """Return a unary function that applies `fn` parameterized by `projector(arg)` to `arg`"""
     def __inner(arg: Any) -> Any:
         return fn(projector(arg))(arg)
     return UnaryFn(__inner)
 
+@stage
 def identity() -> UnaryFn:
     """Return a unary function that returns its argument unchanged"""
     def __inner(arg: Any) -> Any:
         return arg
     return UnaryFn(__inner)
+
+@stage
+def memoize(fn: Callable[..., Any], maxsize: int | None = 128, key: Callable[..., Any] | None = None, policy: str = 'lru', maxbytes: int | None = None, cache: Cache | None = None) -> AnyFn:
+    """Return `fn` caching results by its arguments in `cache` of bounded size"""
+    if cache is None:
+        cache = Cache(maxsize, maxbytes, policy)
+    missing = object()
+
+    if isinstance(fn, NullaryFn):
+        arity = 0
+    elif isinstance(fn, UnaryFn):
+        arity = 1
+    elif isinstance(fn, BinaryFn):
+        arity = 2
+    else:
+        arity = len(inspect.signature(fn).parameters)
+
+    match arity:
+        case 0:
+            def __inner0() -> Any:
+                k = () if key is None else key()
+                value = cache.get(k, missing)
+                if value is missing:
+                    value = fn()
+                    cache.put(k, value)
+                return value
+            return NullaryFn(__inner0)
+        case 1:
+            def __inner1(arg: Any) -> Any:
+                k = arg if key is None else key(arg)
+                value = cache.get(k, missing)
+                if value is missing:
+                    value = fn(arg)
+                    cache.put(k, value)
+                return value
+            return UnaryFn(__inner1)
+        case 2:
+            def __inner2(lhs: Any, rhs: Any) -> Any:
+                k = (lhs, rhs) if key is None else key(lhs, rhs)
+                value = cache.get(k, missing)
+                if value is missing:
+                    value = fn(lhs, rhs)
+                    cache.put(k, value)
+                return value
+            return BinaryFn(__inner2)
+        case _:
+            raise ValueError(f'Unsupported arity for fn ({arity})')
+
+@stage
+def persist(fn: NullaryFn, path: Path | str = '.advent-cache.sqlite') -> NullaryFn:
+    """Return `fn` whose result is stored in SQLite database at `path` keyed by its stages and inputs"""
+    if not isinstance(fn, NullaryFn):
+        raise ValueError(f'Unsupported function {fn!r}, only nullary functions can be persisted')
+    def __inner() -> Any:
+        try:
+            key = _fingerprint(fn)
+        except _Unfingerprintable:
+            return fn()
+        with contextlib.closing(sqlite3.connect(path)) as db, db:
+            db.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)')
+            row = db.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            return pickle.loads(row[0])
+        value = fn()
+        try:
+            blob = pickle.dumps(value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return value
+        with contextlib.closing(sqlite3.connect(path)) as db, db:
+            db.execute('INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)', (key, blob))
+        return value
+    return NullaryFn(__inner)
+
+class _Unfingerprintable(Exception):
+    """Raised for values whose content cannot be hashed, so results depending on them are not cached"""
+
+def _fingerprint(obj: Any) -> str:
+    """Return structural hash of `obj`, hashing content of files (or files matching glob patterns) given to `gn` sources"""
+    digest = hashlib.sha256()
+    _digest(obj, digest, {}, False)
+    return digest.hexdigest()
+
+def _digest(obj: Any, digest: Any, seen: dict[int, Any], source: bool) -> None:
+    def feed(*parts: Any) -> None:
+        for part in parts:
+            digest.update(part if isinstance(part, bytes) else str(part).encode())
+            digest.update(b'\0')
+
+    if isinstance(obj, (str, os.PathLike)) and source and os.path.isfile(obj):
+        feed('file')
+        content = hashlib.sha256()
+        with open(obj, 'rb') as file:
+            while chunk := file.read(1 << 20):
+                content.update(chunk)
+        feed(content.hexdigest())
+        return
+    if isinstance(obj, str) and source and glob.escape(obj) != obj:
+        feed('glob', obj)
+        for match in sorted(glob.glob(obj, recursive=True)):
+            feed(match)
+            _digest(match, digest, seen, source)
+        return
+    if obj is None or isinstance(obj, (str, bytes, int, float, complex, Path)):
+        feed(type(obj).__qualname__, repr(obj))
+        return
+    if id(obj) in seen:
+        feed('cycle')
+        return
+    seen[id(obj)] = obj
+    if isinstance(obj, (NullaryFn, UnaryFn, BinaryFn)):
+        if obj.spec is None:
+            feed(type(obj).__qualname__)
+            _digest(obj.fn, digest, seen, source)
+        else:
+            factory, args, kwargs = obj.spec
+            feed('spec', factory.__module__, factory.__qualname__)
+            _digest((args, kwargs), digest, seen, factory.__module__ == generators.__name__)
+    elif isinstance(obj, Pipeline):
+        feed('pipeline')
+        _digest(obj.stages, digest, seen, source)
+    elif isinstance(obj, (tuple, list)):
+        feed(type(obj).__qualname__, len(obj))
+        for item in obj:
+            _digest(item, digest, seen, source)
+    elif isinstance(obj, dict):
+        feed('dict', len(obj))
+        for key, value in obj.items():
+            _digest(key, digest, seen, source)
+            _digest(value, digest, seen, source)
+    elif isinstance(obj, (set, frozenset)):
+        feed(type(obj).__qualname__, *sorted(_fingerprint(item) for item in obj))
+    elif isinstance(obj, types.FunctionType):
+        feed('function', obj.__module__, obj.__qualname__)
+        _digest(obj.__code__, digest, seen, source)
+        _digest(obj.__defaults__, digest, seen, source)
+        _digest(obj.__kwdefaults__, digest, seen, source)
+        _digest([cell.cell_contents for cell in obj.__closure__ or () if cell.cell_contents is not obj], digest, seen, source)
+        if obj.__module__.partition('.')[0] != __name__.partition('.')[0]:
+            _digest(_globals(obj), digest, seen, source)
+    elif isinstance(obj, types.CodeType):
+        feed('code', obj.co_code, obj.co_names)
+        _digest(obj.co_consts, digest, seen, source)
+    elif isinstance(obj, types.MethodType):
+        feed('method', obj.__func__.__qualname__)
+        _digest(obj.__func__, digest, seen, source)
+        _digest(obj.__self__, digest, seen, source)
+    elif isinstance(obj, (types.BuiltinMethodType, types.MethodWrapperType)) and not isinstance(obj.__self__, (types.ModuleType, type(None))):
+        feed('bound', obj.__qualname__)
+        _digest(obj.__self__, digest, seen, source)
+    elif isinstance(obj, types.ModuleType):
+        feed('module', obj.__name__)
+    elif isinstance(obj, re.Pattern):
+        feed('pattern', repr(obj.pattern), obj.flags)
+    elif isinstance(obj, (type, types.BuiltinFunctionType)) or callable(obj) and hasattr(obj, '__qualname__'):
+        feed('callable', getattr(obj, '__module__', None), obj.__qualname__)
+    else:
+        try:
+            feed('pickle', pickle.dumps(obj))
+        except Exception as error:
+            raise _Unfingerprintable(f'Cannot fingerprint {obj!r}') from error
+
+def _globals(fn: types.FunctionType) -> dict[str, Any]:
+    """Return global values read by code of `fn` (and code nested in it) by name"""
+    names, codes = set(), [fn.__code__]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+    return {name: fn.__globals__[name] for name in sorted(names) if name in fn.__globals__}
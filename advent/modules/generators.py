@@ -1,32 +1,62 @@
+import asyncio
 import builtins
+import concurrent.futures
+import glob
+import io
 import itertools
+import mmap
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from ..classes import NullaryFn
+from ..classes import NullaryFn, stage
+from .grids import Grid
 
 __all__ = [
     'iterate',
+    'iterate_fn',
     'range',
     'irange',
     'infinite_range',
     'read_input',
     'read_file',
+    'aread_file',
+    'read_files',
     'read_file_lines',
+    'read_grid',
+    'stream_file_lines',
+    'stream_file_records',
+    'map_file',
+    'map_file_lines',
+    'map_file_records',
+    'map_file_chunks',
 ]
 
+@stage
 def iterate(iterable: Any) -> NullaryFn:
     """Return iterator for given `iterable` argument"""
     def __inner():
         return iter(iterable)
     return NullaryFn(__inner)
 
+@stage
+def iterate_fn(step: Callable[[Any], Any], init: Any) -> NullaryFn:
+    """Return infinite generator of `init`, `step(init)`, `step(step(init))` and so on"""
+    def __inner():
+        state = init
+        while True:
+            yield state
+            state = step(state)
+    return NullaryFn(__inner)
+
+@stage
 def range(begin: int, end: int, step: int = 1) -> NullaryFn:
     """Return generator for half-open [ `begin`, `end` ) range with given `step`"""
     def __inner():
         return builtins.range(begin, end, step)
     return NullaryFn(__inner)
 
+@stage
 def irange(first: int, last: int, step: int = 1) -> NullaryFn:
     """Return generator for inclusive [ `first`, `last` ] range with given `step`"""
     stop = last + (1 if step > 0 else -1)
@@ -34,18 +64,21 @@ def irange(first: int, last: int, step: int = 1) -> NullaryFn:
         return builtins.range(first, stop, step)
     return NullaryFn(__inner)
 
+@stage
 def infinite_range(first: int = 0, step: int = 1) -> NullaryFn:
     """Return generator for infinite [ `first`, ∞ ) range with given `step`"""
     def __inner():
         return itertools.count(first, step)
     return NullaryFn(__inner)
 
+@stage
 def read_input(prompt: str = '') -> NullaryFn:
     """Return content typed by the user"""
     def __inner():
         return input(prompt)
     return NullaryFn(__inner)
 
+@stage
 def read_file(path: Path | str, encoding: str = 'utf-8') -> NullaryFn:
     """Return content of the file designated by given `path`"""
     def __inner():
@@ -53,9 +86,119 @@ def read_file(path: Path | str, encoding: str = 'utf-8') -> NullaryFn:
             return file.read()
     return NullaryFn(__inner)
 
+@stage
+def aread_file(path: Path | str, encoding: str = 'utf-8') -> NullaryFn:
+    """Return awaitable content of the file designated by given `path` read in worker thread"""
+    def __inner():
+        return asyncio.to_thread(read_file(path, encoding).fn)
+    return NullaryFn(__inner)
+
+@stage
+def read_files(paths: str | Iterable[Path | str], encoding: str = 'utf-8', workers: int | None = None) -> NullaryFn:
+    """Return contents of files matching glob pattern (or given `paths`) keyed by path"""
+    def __inner():
+        keys = sorted(glob.glob(paths, recursive=True)) if isinstance(paths, str) else list(paths)
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            return dict(zip(keys, executor.map(_read_text, keys, itertools.repeat(encoding))))
+    return NullaryFn(__inner)
+
+@stage
 def read_file_lines(path: Path | str, encoding: str = 'utf-8') -> NullaryFn:
     """Return lines of the file designated by given `path`"""
     def __inner():
         with open(path, 'r', encoding=encoding) as file:
             return file.read().splitlines()
     return NullaryFn(__inner)
+
+@stage
+def read_grid(path: Path | str, digits: bool = False) -> NullaryFn:
+    """Return `Grid` of characters (or digit values if `digits`) of the file designated by given `path`"""
+    def __inner():
+        with open(path, 'rb') as file:
+            return Grid.from_text(file.read(), digits)
+    return NullaryFn(__inner)
+
+@stage
+def stream_file_lines(path: Path | str, encoding: str = 'utf-8', buffer_size: int = io.DEFAULT_BUFFER_SIZE) -> NullaryFn:
+    """Return generator of lines of the file designated by given `path` read lazily through buffer of `buffer_size`"""
+    def __inner():
+        with open(path, 'r', encoding=encoding, buffering=buffer_size) as file:
+            for line in file:
+                yield line[:-1] if line.endswith('\n') else line
+    return NullaryFn(__inner)
+
+@stage
+def stream_file_records(path: Path | str, separator: str = '\n\n', encoding: str = 'utf-8', buffer_size: int = io.DEFAULT_BUFFER_SIZE) -> NullaryFn:
+    """Return generator of `separator` delimited records of the file designated by given `path`"""
+    def __inner():
+        overlap = len(separator) - 1
+        with open(path, 'r', encoding=encoding, buffering=buffer_size) as file:
+            parts, tail = [], ''
+            while chunk := file.read(buffer_size):
+                if separator not in tail + chunk:
+                    parts.append(chunk)
+                    tail = (tail + chunk)[-overlap:] if overlap else ''
+                    continue
+                records = (''.join(parts) + chunk).split(separator)
+                pending = records.pop()
+                yield from records
+                parts, tail = [pending], pending[-overlap:] if overlap else ''
+            yield ''.join(parts)
+    return NullaryFn(__inner)
+
+@stage
+def map_file(path: Path | str) -> NullaryFn:
+    """Return read-only memory mapped content of the file designated by given `path` as memoryview"""
+    def __inner():
+        return memoryview(_map(path))
+    return NullaryFn(__inner)
+
+@stage
+def map_file_lines(path: Path | str) -> NullaryFn:
+    """Return generator of memoryview lines of the memory mapped file designated by given `path`"""
+    def __inner():
+        mapping = _map(path)
+        view = memoryview(mapping)
+        start, size = 0, len(mapping)
+        while start < size:
+            end = mapping.find(b'\n', start)
+            if end == -1:
+                end = size
+            yield view[start:end]
+            start = end + 1
+    return NullaryFn(__inner)
+
+@stage
+def map_file_records(path: Path | str, separator: bytes = b'\n\n') -> NullaryFn:
+    """Return generator of `separator` delimited memoryview records of the memory mapped file designated by given `path`"""
+    def __inner():
+        return _split(_map(path), separator)
+    return NullaryFn(__inner)
+
+@stage
+def map_file_chunks(path: Path | str, size: int) -> NullaryFn:
+    """Return generator of fixed `size` memoryview records of the memory mapped file designated by given `path`"""
+    def __inner():
+        view = memoryview(_map(path))
+        for start in builtins.range(0, len(view), size):
+            yield view[start:start + size]
+    return NullaryFn(__inner)
+
+def _map(path: Path | str) -> mmap.mmap | bytes:
+    with open(path, 'rb') as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b''
+
+def _split(mapping: mmap.mmap | bytes, separator: bytes):
+    view = memoryview(mapping)
+    start = 0
+    while (end := mapping.find(separator, start)) != -1:
+        yield view[start:end]
+        start = end + len(separator)
+    yield view[start:]
+
+def _read_text(path: Path | str, encoding: str) -> str:
+    with open(path, 'r', encoding=encoding) as file:
+        return file.read()
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import array
+import itertools
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable
+
+from ..classes import UnaryFn, stage
+
+try:
+    import numpy
+    _ARRAY = numpy.ndarray
+except ImportError:
+    numpy = None
+    _ARRAY = ()
+
+__all__ = [
+    'Grid',
+    'parse_grid',
+    'to_grid',
+    'map_cells',
+]
+
+_OFFSETS = {
+    4: ((0, -1, 0), (1, 0, 0), (0, 1, 0), (-1, 0, 0)),
+    8: tuple((dx, dy, 0) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy),
+    6: ((0, -1, 0), (1, 0, 0), (0, 1, 0), (-1, 0, 0), (0, 0, -1), (0, 0, 1)),
+    26: tuple((dx, dy, dz) for dz in (-1, 0, 1) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy or dz),
+}
+
+_DIGITS = bytes(byte - 48 if 48 <= byte <= 57 else byte for byte in range(256))
+
+class Grid:
+    __slots__ = ('cells', 'width', 'height', 'depth', '_tables')
+
+    def __init__(self, cells: Any, width: int, height: int, depth: int = 1) -> None:
+        if len(cells) != width * height * depth:
+            raise ValueError(f'Grid of shape {(width, height, depth)} requires {width * height * depth} cells, got {len(cells)}')
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.depth = depth
+        self._tables = {}
+
+    @classmethod
+    def from_text(cls, text: str | bytes, digits: bool = False) -> Grid:
+        """Return grid of bytes of equally long lines of `text` (with digit characters turned into their values if `digits`)"""
+        rows = (text.encode() if isinstance(text, str) else bytes(text)).splitlines()
+        while rows and not rows[-1]:
+            rows.pop()
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError('Grid rows have different lengths')
+        cells = bytearray().join(rows)
+        if digits:
+            cells = cells.translate(_DIGITS)
+        return cls(cells, width, len(rows))
+
+    @classmethod
+    def filled(cls, width: int, height: int, depth: int = 1, fill: int = 0, typecode: str | None = None) -> Grid:
+        """Return grid with all cells set to `fill`, stored as bytearray or `array` of given `typecode`"""
+        size = width * height * depth
+        if typecode is None:
+            return cls(bytearray([fill]) * size, width, height, depth)
+        return cls(array.array(typecode, [fill]) * size, width, height, depth)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        if self.depth == 1:
+            return self.width, self.height
+        return self.width, self.height, self.depth
+
+    def index(self, x: int, y: int, z: int = 0) -> int:
+        """Return flat index of cell at given coordinates"""
+        return x + self.width * (y + self.height * z)
+
+    def position(self, index: int) -> tuple[int, ...]:
+        """Return coordinates of cell at flat `index`"""
+        x, y, z = self._coords(index)
+        if self.depth == 1:
+            return x, y
+        return x, y, z
+
+    def inside(self, x: int, y: int, z: int = 0) -> bool:
+        """Check whether given coordinates lie within the grid"""
+        return 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.depth
+
+    def neighbours(self, index: int, connectivity: int = 4) -> list[int]:
+        """Return flat indices of cells adjacent to `index` with 4 or 8 (2D), 6 or 26 (3D) `connectivity`"""
+        offsets, deltas = self._tables.get(connectivity) or self._table(connectivity)
+        width, height, depth = self.width, self.height, self.depth
+        rest, x = divmod(index, width)
+        z, y = divmod(rest, height)
+        if 0 < x < width - 1 and 0 < y < height - 1 and (connectivity < 6 or 0 < z < depth - 1):
+            return [index + delta for delta in deltas]
+        return [
+            index + delta
+            for (dx, dy, dz), delta in zip(offsets, deltas)
+            if 0 <= x + dx < width and 0 <= y + dy < height and 0 <= z + dz < depth
+        ]
+
+    def find(self, value: Any) -> int:
+        """Return flat index of first cell equal to `value` or -1 if there is none"""
+        if isinstance(self.cells, (bytes, bytearray)):
+            return self.cells.find(_byte(value))
+        for i, cell in enumerate(self.cells):
+            if cell == value:
+                return i
+        return -1
+
+    def find_all(self, value: Any) -> list[int]:
+        """Return flat indices of all cells equal to `value`"""
+        if isinstance(self.cells, (bytes, bytearray)):
+            value, found, i = _byte(value), [], -1
+            while (i := self.cells.find(value, i + 1)) != -1:
+                found.append(i)
+            return found
+        return [i for i, cell in enumerate(self.cells) if cell == value]
+
+    def row(self, y: int, z: int = 0) -> Any:
+        """Return view of row `y` (of layer `z`) sharing memory with the grid"""
+        start = self.width * (y + self.height * z)
+        return self._view()[start:start + self.width]
+
+    def column(self, x: int, z: int = 0) -> Any:
+        """Return view of column `x` (of layer `z`) sharing memory with the grid"""
+        start = self.width * self.height * z
+        return self._view()[start + x:start + self.width * self.height:self.width]
+
+    def diagonal(self, x: int = 0, y: int = 0, anti: bool = False) -> Any:
+        """Return view of diagonal going down-right (or down-left if `anti`) from given coordinates"""
+        start = self.index(x, y)
+        if anti:
+            count, step = min(x + 1, self.height - y), self.width - 1
+        else:
+            count, step = min(self.width - x, self.height - y), self.width + 1
+        if count <= 0:
+            return self._view()[0:0]
+        return self._view()[start:start + step * (count - 1) + 1:step or 1]
+
+    def rows(self) -> Iterator[Any]:
+        """Return views of all rows of all layers"""
+        view = self._view()
+        return (view[start:start + self.width] for start in range(0, len(self.cells), self.width))
+
+    def transpose(self) -> Grid:
+        """Return new 2D grid with rows and columns swapped"""
+        self._planar('transpose')
+        return Grid(_concat(self.cells, (self.cells[x::self.width] for x in range(self.width))), self.height, self.width)
+
+    def rotate(self, turns: int = 1) -> Grid:
+        """Return new 2D grid rotated clockwise by `turns` quarter turns (negative for counterclockwise)"""
+        self._planar('rotate')
+        cells, width, height = self.cells, self.width, self.height
+        turns %= 4
+        if turns == 0:
+            return self.copy()
+        if turns == 2:
+            return Grid(_concat(cells, (cells[::-1],)), width, height)
+        if turns == 1:
+            columns = (cells[(height - 1) * width + x::-width] for x in range(width))
+        else:
+            columns = (cells[x::width] for x in reversed(range(width)))
+        return Grid(_concat(cells, columns), height, width)
+
+    def copy(self) -> Grid:
+        return Grid(self.cells[:] if not isinstance(self.cells, _ARRAY) else self.cells.copy(), self.width, self.height, self.depth)
+
+    def __getitem__(self, key: int | tuple[int, ...]) -> Any:
+        if isinstance(key, tuple):
+            key = self.index(*key)
+        return self.cells[key]
+
+    def __setitem__(self, key: int | tuple[int, ...], value: Any) -> None:
+        if isinstance(key, tuple):
+            key = self.index(*key)
+        self.cells[key] = value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.shape == other.shape and list(self.cells) == list(other.cells)
+
+    def __str__(self) -> str:
+        if isinstance(self.cells, (bytes, bytearray)) and self.cells:
+            if min(self.cells) >= 32:
+                return '\n'.join(bytes(row).decode('latin-1') for row in self.rows())
+            if max(self.cells) < 10:
+                return '\n'.join(''.join(map(str, row)) for row in self.rows())
+        return '\n'.join(' '.join(map(str, row)) for row in self.rows())
+
+    def __repr__(self) -> str:
+        return f"Grid(shape={self.shape}, cells={type(self.cells).__name__})"
+
+    def _coords(self, index: int) -> tuple[int, int, int]:
+        rest, x = divmod(index, self.width)
+        z, y = divmod(rest, self.height)
+        return x, y, z
+
+    def _table(self, connectivity: int) -> tuple[tuple[tuple[int, int, int], ...], tuple[int, ...]]:
+        """Return neighbour offsets of given `connectivity` and matching flat index deltas (computed once per grid)"""
+        if connectivity not in _OFFSETS:
+            raise ValueError(f'Unsupported connectivity {connectivity!r}')
+        if connectivity in (6, 26) and self.depth == 1:
+            raise ValueError(f'Connectivity {connectivity} requires 3D grid')
+        offsets = _OFFSETS[connectivity]
+        deltas = tuple(dx + self.width * (dy + self.height * dz) for dx, dy, dz in offsets)
+        self._tables[connectivity] = offsets, deltas
+        return offsets, deltas
+
+    def _view(self) -> Any:
+        if isinstance(self.cells, (_ARRAY, list)):
+            return self.cells
+        return memoryview(self.cells)
+
+    def _planar(self, operation: str) -> None:
+        if self.depth != 1:
+            raise ValueError(f'Grid {operation} requires 2D grid')
+
+@stage
+def parse_grid(digits: bool = False) -> UnaryFn:
+    """Return `Grid` of equally long lines of the text (with digit characters turned into their values if `digits`)"""
+    def __inner(text: str | bytes) -> Grid:
+        return Grid.from_text(text, digits)
+    return UnaryFn(__inner)
+
+@stage
+def to_grid(width: int, height: int | None = None, typecode: str | None = None) -> UnaryFn:
+    """Return `Grid` of given `width` filled row by row with elements, stored as bytearray or `array` of given `typecode`"""
+    def __inner(iterable: Iterable[int]) -> Grid:
+        cells = bytearray(iterable) if typecode is None else array.array(typecode, iterable)
+        rows = height or len(cells) // width
+        return Grid(cells, width, rows, len(cells) // (width * rows) if cells else 1)
+    return UnaryFn(__inner)
+
+@stage
+def map_cells(mapper: Callable[[Any], int], typecode: str | None = None) -> UnaryFn:
+    """Return new `Grid` of the same shape with `mapper` applied to each cell"""
+    def __inner(grid: Grid) -> Grid:
+        cells = map(mapper, grid.cells)
+        cells = bytearray(cells) if typecode is None else array.array(typecode, cells)
+        return Grid(cells, grid.width, grid.height, grid.depth)
+    return UnaryFn(__inner)
+
+def _byte(value: Any) -> Any:
+    return value.encode() if isinstance(value, str) else value
+
+def _concat(cells: Any, pieces: Iterable[Any]) -> Any:
+    """Return pieces sliced out of `cells` joined into single buffer of the same kind"""
+    if isinstance(cells, (bytes, bytearray)):
+        return type(cells)().join(pieces)
+    if isinstance(cells, array.array):
+        result = array.array(cells.typecode)
+        for piece in pieces:
+            result.extend(piece)
+        return result
+    if isinstance(cells, _ARRAY):
+        return numpy.concatenate(list(pieces))
+    return list(itertools.chain.from_iterable(pieces))
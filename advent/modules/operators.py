@@ -1,9 +1,15 @@
 import builtins
 import math
 import operator
+from typing import Any, Callable
 
 from ..classes import BinaryFn, UnaryFn
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 __all__ = [
     'eq',
     'ne',
@@ -43,6 +49,7 @@ __all__ = [
     'gcd',
     'even',
     'odd',
+    'vectorized',
 ]
 
 eq = BinaryFn(operator.eq)
@@ -158,3 +165,91 @@ even = UnaryFn(lambda a: a % 2 == 0)
 
 odd = UnaryFn(lambda a: a % 2 != 0)
 """Return `a % 2 != 0`"""
+
+def vectorized(fn: Callable[..., Any]) -> Callable[..., Any] | None:
+    """Return NumPy counterpart of operator `fn` that works on whole arrays, or None if there is none"""
+    if numpy is None:
+        return None
+    try:
+        if (ufunc := _VECTORIZED.get(fn)) is not None:
+            return ufunc
+    except TypeError:
+        return None
+    if isinstance(fn, UnaryFn) and fn.spec is not None:
+        factory, args, _ = fn.spec
+        if factory is BinaryFn.right and (ufunc := _VECTORIZED.get(args[0])) is not None:
+            rhs = args[1]
+            return lambda a: ufunc(a, rhs)
+        if factory is BinaryFn.left and (ufunc := _VECTORIZED.get(args[0])) is not None:
+            lhs = args[1]
+            return lambda a: ufunc(lhs, a)
+    return None
+
+def _vectorized_table() -> dict[Any, Callable[..., Any]]:
+    table = {
+        eq: numpy.equal,
+        ne: numpy.not_equal,
+        lt: numpy.less,
+        le: numpy.less_equal,
+        gt: numpy.greater,
+        ge: numpy.greater_equal,
+        logic_not: numpy.logical_not,
+        logic_or: lambda a, b: numpy.where(a, a, b),
+        logic_and: lambda a, b: numpy.where(a, b, a),
+        logic_xor: numpy.logical_xor,
+        bit_not: numpy.invert,
+        bit_or: numpy.bitwise_or,
+        bit_and: numpy.bitwise_and,
+        bit_xor: numpy.bitwise_xor,
+        bit_lsh: numpy.left_shift,
+        bit_rsh: numpy.right_shift,
+        plus: numpy.positive,
+        minus: numpy.negative,
+        inc: inc.fn,
+        dec: dec.fn,
+        add: numpy.add,
+        sub: numpy.subtract,
+        mul: numpy.multiply,
+        div: _nonzero(numpy.true_divide),
+        idiv: _nonzero(numpy.floor_divide),
+        mod: _nonzero(numpy.mod),
+        pow: _power,
+        abs: numpy.absolute,
+        sign: lambda a: numpy.greater(a, 0).astype(numpy.int64) - numpy.less(a, 0),
+        diff: lambda a, b: numpy.absolute(numpy.subtract(a, b)),
+        min: numpy.minimum,
+        max: numpy.maximum,
+        lcm: numpy.lcm,
+        gcd: numpy.gcd,
+        even: even.fn,
+        odd: odd.fn,
+    }
+    for fn, ufunc in list(table.items()):
+        if fn.fn.__name__ != '<lambda>':
+            table[fn.fn] = ufunc
+    return table
+
+def _nonzero(ufunc: Any) -> Callable[[Any, Any], Any]:
+    """Return `ufunc` raising ZeroDivisionError for zero divisors like Python does instead of warning"""
+    def __inner(a: Any, b: Any) -> Any:
+        if not numpy.all(b):
+            raise ZeroDivisionError(f'{ufunc.__name__} by zero')
+        return ufunc(a, b)
+    return __inner
+
+def _power(a: Any, b: Any) -> Any:
+    """Return `numpy.power` switching to float power for negative integer exponents like Python does"""
+    if numpy.result_type(a, b).kind in 'iu' and numpy.any(numpy.asarray(b) < 0):
+        return numpy.float_power(a, b)
+    return numpy.power(a, b)
+
+_VECTORIZED = _vectorized_table() if numpy is not None else {}
+
+def _lookup(name: str) -> UnaryFn | BinaryFn:
+    return globals()[name]
+
+_lookup.describe = 'op.{}'.format
+
+for _name in __all__:
+    if isinstance(_fn := globals()[_name], (UnaryFn, BinaryFn)):
+        _fn.spec = (_lookup, (_name,), {})
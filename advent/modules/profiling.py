@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Iterator, Sized
+from typing import Any
+
+from ..classes import AnyFn, BinaryFn, NullaryFn, Pipeline, UnaryFn
+
+__all__ = [
+    'Profile',
+    'StageStats',
+    'profile',
+]
+
+class StageStats:
+    __slots__ = ('label', 'depth', 'source', 'calls', 'arguments', 'items_out', 'self_time', 'self_alloc')
+
+    def __init__(self, label: str, depth: int, source: StageStats | None) -> None:
+        self.label = label
+        self.depth = depth
+        self.source = source
+        self.calls = 0
+        self.arguments = None
+        self.items_out = 0
+        self.self_time = 0.0
+        self.self_alloc = 0
+
+    @property
+    def items_in(self) -> int | None:
+        if self.source is not None:
+            return self.source.items_out
+        return self.arguments
+
+    def __repr__(self) -> str:
+        return f"StageStats({self.label!r}, calls={self.calls}, items_in={self.items_in}, items_out={self.items_out}, self_time={self.self_time:.6f})"
+
+class Profile:
+    __slots__ = ('stages', 'result', 'memory', '_active', '_mark', '_memory_mark')
+
+    def __init__(self, memory: bool = False) -> None:
+        self.stages = []
+        self.result = None
+        self.memory = memory
+        self._active = []
+        self._mark = 0.0
+        self._memory_mark = 0
+
+    def total_time(self, index: int) -> float:
+        """Return time spent in stage at `index` including stages of pipelines nested in it"""
+        return self._subtree(index, 'self_time')
+
+    def total_alloc(self, index: int) -> int:
+        """Return bytes allocated by stage at `index` including stages of pipelines nested in it"""
+        return self._subtree(index, 'self_alloc')
+
+    def report(self, width: int = 30) -> str:
+        """Return per-stage report as indented tree with bars proportional to self time"""
+        overall = sum(stats.self_time for stats in self.stages) or 1.0
+        label_width = max((2 * stats.depth + len(stats.label) for stats in self.stages), default=5)
+        lines = [f"{'stage':<{label_width}} {'calls':>8} {'in':>10} {'out':>10} {'self ms':>10} {'total ms':>10}" + (f" {'alloc KiB':>10}" if self.memory else '')]
+        for i, stats in enumerate(self.stages):
+            items_in = '-' if stats.items_in is None else str(stats.items_in)
+            line = f"{'  ' * stats.depth + stats.label:<{label_width}} {stats.calls:>8} {items_in:>10} {stats.items_out:>10} {stats.self_time * 1e3:>10.3f} {self.total_time(i) * 1e3:>10.3f}"
+            if self.memory:
+                line += f" {self.total_alloc(i) / 1024:>10.1f}"
+            lines.append(f"{line} {'█' * round(width * stats.self_time / overall)}")
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        return self.report()
+
+    def _subtree(self, index: int, attribute: str) -> Any:
+        depth = self.stages[index].depth
+        total = getattr(self.stages[index], attribute)
+        for stats in self.stages[index + 1:]:
+            if stats.depth <= depth:
+                break
+            total += getattr(stats, attribute)
+        return total
+
+    def _enter(self, stats: StageStats) -> None:
+        self._switch()
+        self._active.append(stats)
+
+    def _exit(self) -> None:
+        self._switch()
+        self._active.pop()
+
+    def _switch(self) -> None:
+        """Charge time (and memory) elapsed since the last switch to the currently running stage"""
+        now = time.perf_counter()
+        if self._active:
+            self._active[-1].self_time += now - self._mark
+        self._mark = now
+        if self.memory:
+            current, _ = tracemalloc.get_traced_memory()
+            if self._active:
+                self._active[-1].self_alloc += current - self._memory_mark
+            self._memory_mark = current
+
+def profile(fn: AnyFn, *args: Any, memory: bool = False) -> Profile:
+    """Run `fn` with `args` recording time, element counts and optionally allocations of each stage"""
+    report = Profile(memory)
+    instrumented = _instrument(fn, report, 0)
+    tracing = memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    try:
+        report._switch()
+        report.result = instrumented(*args)
+    except BaseException:
+        if tracing:
+            tracemalloc.stop()
+        raise
+    if tracing:
+        if isinstance(report.result, Iterator):
+            report.result = _traced(report.result)
+        else:
+            tracemalloc.stop()
+    return report
+
+def _instrument(fn: AnyFn, report: Profile, depth: int) -> AnyFn:
+    stages = fn.stages
+    instrumented = []
+    previous = None
+    for item in stages:
+        stats = StageStats(_label(item), depth, previous)
+        report.stages.append(stats)
+        instrumented.append(_instrument_stage(_rebuild(item, report, depth + 1), stats, report))
+        previous = stats
+    if len(instrumented) == 1:
+        return instrumented[0]
+    return type(fn)(Pipeline(tuple(instrumented)))
+
+def _instrument_stage(stage: AnyFn, stats: StageStats, report: Profile) -> AnyFn:
+    inner = stage.fn
+    def __inner(*args: Any) -> Any:
+        if stats.source is None and args:
+            count = len(args[0]) if len(args) == 1 and isinstance(args[0], Sized) and not isinstance(args[0], (str, bytes)) else 1
+            stats.arguments = (stats.arguments or 0) + count
+        report._enter(stats)
+        try:
+            result = inner(*args)
+        finally:
+            report._exit()
+        stats.calls += 1
+        if isinstance(result, Iterator):
+            return _counted(result, stats, report)
+        stats.items_out += len(result) if isinstance(result, Sized) and not isinstance(result, (str, bytes)) else 1
+        return result
+    return type(stage)(__inner)
+
+def _counted(it: Iterator, stats: StageStats, report: Profile):
+    while True:
+        report._enter(stats)
+        try:
+            item = next(it)
+        except StopIteration:
+            return
+        finally:
+            report._exit()
+        stats.items_out += 1
+        yield item
+
+def _traced(it: Iterator):
+    """Yield items of lazy result stopping memory tracing started by `profile` once it is exhausted or closed"""
+    try:
+        yield from it
+    finally:
+        tracemalloc.stop()
+
+def _rebuild(stage: AnyFn, report: Profile, depth: int) -> AnyFn:
+    """Return `stage` rebuilt from its spec with nested pipeline arguments instrumented"""
+    if stage.spec is None:
+        return stage
+    factory, args, kwargs = stage.spec
+    if not any(_is_pipeline(arg) for arg in (*args, *kwargs.values())):
+        return stage
+    args = tuple(_instrument(arg, report, depth) if _is_pipeline(arg) else arg for arg in args)
+    kwargs = {key: _instrument(value, report, depth) if _is_pipeline(value) else value for key, value in kwargs.items()}
+    return factory(*args, **kwargs)
+
+def _is_pipeline(obj: Any) -> bool:
+    return isinstance(obj, (NullaryFn, UnaryFn, BinaryFn)) and isinstance(obj.fn, Pipeline)
+
+def _label(stage: AnyFn) -> str:
+    if stage.spec is None:
+        return getattr(stage.fn, '__qualname__', repr(stage.fn))
+    factory, args, kwargs = stage.spec
+    if (describe := getattr(factory, 'describe', None)) is not None:
+        return describe(*args, **kwargs)
+    arguments = [*args, *kwargs.values()]
+    described = ', '.join('…' if _is_pipeline(arg) else _short(repr(arg)) for arg in arguments)
+    return f"{factory.__module__.rpartition('.')[2]}.{factory.__qualname__}({described})"
+
+def _short(text: str, limit: int = 24) -> str:
+    return text if len(text) <= limit else text[:limit - 1] + '…'
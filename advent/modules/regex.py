@@ -1,7 +1,10 @@
+import builtins
+import collections
 import re
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, Callable
 
-from ..classes import UnaryFn
+from ..classes import Cache, UnaryFn, stage
 
 __all__ = [
     'split',
@@ -9,30 +12,51 @@ __all__ = [
     'find_all',
     'find_first',
     'find_last',
+    'parse',
+    'parse_all',
+    'compile',
+    'pattern_cache',
 ]
 
+pattern_cache = Cache(maxsize=1024)
+"""Shared bounded cache of patterns compiled by `compile`"""
+
+@stage
 def split(pattern: str | re.Pattern[str], limit: int = 0) -> UnaryFn:
     """Return list of substrings split by occurrences matching `pattern`"""
+    text, binary = compile(pattern).split, _binary_pattern(pattern)
     def __inner(s: str) -> list[str | Any]:
-        return re.split(pattern, s, limit)
+        if isinstance(s, str):
+            return text(s, limit)
+        return binary().split(s, limit)
     return UnaryFn(__inner)
 
+@stage
 def replace(pattern: str | re.Pattern[str], new: str) -> UnaryFn:
     """Return string with all occurrences matching `pattern` replaced by `new`"""
+    text, binary, binary_new = compile(pattern).sub, _binary_pattern(pattern), _binary(new)
     def __inner(s: str) -> str:
-        return re.sub(pattern, new, s)
+        if isinstance(s, str):
+            return text(new, s)
+        return binary().sub(binary_new, s)
     return UnaryFn(__inner)
 
+@stage
 def find_all(pattern: str | re.Pattern[str]) -> UnaryFn:
     """Return list of all occurrences matching `pattern`"""
+    text, binary = compile(pattern).findall, _binary_pattern(pattern)
     def __inner(s: str) -> list[Any]:
-        return re.findall(pattern, s)
+        if isinstance(s, str):
+            return text(s)
+        return binary().findall(s)
     return UnaryFn(__inner)
 
+@stage
 def find_first(pattern: str | re.Pattern[str]) -> UnaryFn:
     """Return first occurrence matching `pattern`, or None if not found"""
+    text, binary = compile(pattern).search, _binary_pattern(pattern)
     def __inner(s: str) -> Any:
-        match = re.search(pattern, s)
+        match = text(s) if isinstance(s, str) else binary().search(s)
         if not match:
             return None
         groups = match.groups()
@@ -41,9 +65,121 @@ def find_first(pattern: str | re.Pattern[str]) -> UnaryFn:
         return groups[0] if len(groups) == 1 else groups
     return UnaryFn(__inner)
 
+@stage
 def find_last(pattern: str | re.Pattern[str]) -> UnaryFn:
     """Return last occurrence matching `pattern`, or None if not found"""
+    text, binary = compile(pattern).finditer, _binary_pattern(pattern)
+    def __inner(s: str) -> Any:
+        last = collections.deque(text(s) if isinstance(s, str) else binary().finditer(s), maxlen=1)
+        if not last:
+            return None
+        match = last[0]
+        if match.re.groups == 0:
+            return match.group(0)
+        groups = match.groups('')
+        return groups[0] if len(groups) == 1 else groups
+    return UnaryFn(__inner)
+
+@stage
+def parse(template: str) -> UnaryFn:
+    """Return typed fields of string matching whole `template` like `{name:int}`, or None"""
+    source, convert = _template(template)
+    text, binary = compile(source).fullmatch, _binary_pattern(source)
     def __inner(s: str) -> Any:
-        matches = re.findall(pattern, s)
-        return matches[-1] if matches else None
+        match = text(s) if isinstance(s, str) else binary().fullmatch(s)
+        if not match:
+            return None
+        return convert(match.group(1) if match.re.groups == 1 else match.groups())
     return UnaryFn(__inner)
+
+@stage
+def parse_all(template: str) -> UnaryFn:
+    """Return typed fields of every line of the whole text matching `template` (see `parse`) found in a single scan"""
+    source, convert = _template(template)
+    source = f'(?m)^{source}$'
+    text, binary = compile(source).findall, _binary_pattern(source)
+    def __inner(s: str) -> Iterable:
+        found = text(s) if isinstance(s, str) else binary().findall(s)
+        return builtins.map(convert, found)
+    return UnaryFn(__inner)
+
+def compile(pattern: str | bytes | re.Pattern) -> re.Pattern:
+    """Return compiled `pattern` (cached in `pattern_cache`)"""
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    compiled = pattern_cache.get(pattern)
+    if compiled is None:
+        compiled = re.compile(pattern)
+        pattern_cache.put(pattern, compiled)
+    return compiled
+
+def _binary_pattern(pattern: str | bytes | re.Pattern) -> Callable[[], re.Pattern[bytes]]:
+    """Return function compiling `pattern` for bytes-like strings once, on first use, and returning it afterwards"""
+    compiled = []
+    def __inner() -> re.Pattern[bytes]:
+        if not compiled:
+            binary = _binary(pattern)
+            compiled.append(binary if isinstance(binary, re.Pattern) else re.compile(binary))
+        return compiled[0]
+    return __inner
+
+def _binary(pattern: str | bytes | re.Pattern) -> bytes | re.Pattern[bytes]:
+    """Return `pattern` (or replacement) usable with bytes-like strings such as memory mapped files"""
+    if isinstance(pattern, str):
+        return pattern.encode()
+    if isinstance(pattern, re.Pattern) and isinstance(pattern.pattern, str):
+        return re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+    return pattern
+
+_FIELD_TYPES = {
+    'int': (r'[-+]?\d+', int),
+    'float': (r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?', float),
+    'word': (r'\w+', None),
+    'char': (r'.', None),
+    'str': (r'.+?', None),
+}
+
+_FIELD = re.compile(r'\{\{|\}\}|\{(?:(\w+):)?(\w*)\}')
+
+def _template(template: str) -> tuple[str, Callable[[Any], Any]]:
+    """Return regex source for `template` and function converting its (single group or tuple of) groups into typed record"""
+    parts, converters, names = [], [], []
+    position = 0
+    for field in _FIELD.finditer(template):
+        parts.append(re.escape(template[position:field.start()]))
+        position = field.end()
+        if field.group(0) in ('{{', '}}'):
+            parts.append(re.escape(field.group(0)[0]))
+            continue
+        name, kind = field.group(1), field.group(2) or 'str'
+        if kind not in _FIELD_TYPES:
+            raise ValueError(f'Unsupported field type {kind!r} in template {template!r}')
+        regex, converter = _FIELD_TYPES[kind]
+        parts.append(f'({regex})')
+        converters.append(converter)
+        names.append(name)
+    if not converters:
+        raise ValueError(f'Template {template!r} has no fields')
+    parts.append(re.escape(template[position:]))
+    return ''.join(parts), _converter(converters, names)
+
+def _converter(converters: list[Callable[[Any], Any] | None], names: list[str | None]) -> Callable[[Any], Any]:
+    if builtins.any(names):
+        record = collections.namedtuple('Record', [name or f'field{i}' for i, name in enumerate(names)], rename=True)
+        convert = _converter(converters, [None] * len(names))
+        if len(converters) == 1:
+            return lambda group: record(convert(group))
+        return lambda groups: record._make(convert(groups))
+    if len(converters) == 1:
+        return converters[0] or _unchanged
+    kinds = set(converters)
+    if kinds == {None}:
+        return _unchanged
+    if len(kinds) == 1:
+        converter = converters[0]
+        return lambda groups: tuple(builtins.map(converter, groups))
+    converters = [converter or _unchanged for converter in converters]
+    return lambda groups: tuple([converter(group) for converter, group in zip(converters, groups)])
+
+def _unchanged(value: Any) -> Any:
+    return value
@@ -0,0 +1,192 @@
+import functools
+import heapq
+import itertools
+import operator
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from typing import Any, Callable
+
+from ..classes import UnaryFn, stage
+from .sequences import _callable, _outside
+
+__all__ = [
+    'bfs',
+    'dijkstra',
+    'a_star',
+    'bidirectional',
+    'flood_fill',
+    'connected_components',
+]
+
+@stage
+def bfs(neighbours: Callable[[Any], Iterable] | Mapping, goal: Any = None, size: int | None = None) -> UnaryFn:
+    """Return (state, distance) pairs reachable from the start state in breadth-first order"""
+    expand, reached = _callable(neighbours), _goal(goal)
+    def __inner(start: Hashable) -> Iterator[tuple[Any, int]]:
+        seen, spread = _visited(size)
+        _mark(seen, start)
+        frontier, distance = [start], 0
+        while frontier:
+            for state in frontier:
+                yield state, distance
+                if reached is not None and reached(state):
+                    return
+            frontier, distance = spread(frontier, expand, seen), distance + 1
+    return UnaryFn(__inner)
+
+@stage
+def dijkstra(neighbours: Callable[[Any], Iterable] | Mapping, cost: Callable[[Any, Any], Any] | None = None, goal: Any = None) -> UnaryFn:
+    """Return (state, distance) pairs reachable from the start state in order of distance"""
+    edges, reached = _edges(neighbours, cost), _goal(goal)
+    def __inner(start: Hashable) -> Iterator[tuple[Any, Any]]:
+        return _best_first(start, edges, None, reached)
+    return UnaryFn(__inner)
+
+@stage
+def a_star(neighbours: Callable[[Any], Iterable] | Mapping, heuristic: Callable[[Any], Any], goal: Any, cost: Callable[[Any, Any], Any] | None = None) -> UnaryFn:
+    """Return (state, distance) pairs settled on the way to `goal` guided by `heuristic`"""
+    edges, estimate, reached = _edges(neighbours, cost), _callable(heuristic), _goal(goal)
+    def __inner(start: Hashable) -> Iterator[tuple[Any, Any]]:
+        return _best_first(start, edges, estimate, reached)
+    return UnaryFn(__inner)
+
+@stage
+def bidirectional(neighbours: Callable[[Any], Iterable] | Mapping, goal: Hashable, predecessors: Callable[[Any], Iterable] | Mapping | None = None, undirected: bool = False) -> UnaryFn:
+    """Return shortest path from the start state to `goal` searched from both ends (back through `predecessors`), or None"""
+    if predecessors is None and not undirected:
+        raise ValueError('Bidirectional search of directed graph requires predecessors')
+    expand = _callable(neighbours)
+    retreat = expand if predecessors is None else _callable(predecessors)
+    def __inner(start: Hashable) -> list[Any] | None:
+        if start == goal:
+            return [start]
+        forward, backward = {start: None}, {goal: None}
+        ahead, behind = [start], [goal]
+        while ahead and behind:
+            if len(ahead) <= len(behind):
+                ahead, meeting = _layer(ahead, expand, forward, backward)
+            else:
+                behind, meeting = _layer(behind, retreat, backward, forward)
+            if meeting is not None:
+                return _walk(meeting, forward)[::-1] + _walk(backward[meeting], backward)
+        return None
+    return UnaryFn(__inner)
+
+@stage
+def flood_fill(neighbours: Callable[[Any], Iterable] | Mapping, size: int | None = None) -> UnaryFn:
+    """Return generator of states reachable from the start state, layer by layer"""
+    expand = _callable(neighbours)
+    def __inner(start: Hashable) -> Iterator[Any]:
+        seen, spread = _visited(size)
+        _mark(seen, start)
+        frontier = [start]
+        while frontier:
+            yield from frontier
+            frontier = spread(frontier, expand, seen)
+    return UnaryFn(__inner)
+
+@stage
+def connected_components(neighbours: Callable[[Any], Iterable] | Mapping, size: int | None = None) -> UnaryFn:
+    """Return generator of lists of states connected to each other, one list per component of the given states"""
+    expand = _callable(neighbours)
+    def __inner(states: Iterable[Hashable]) -> Iterator[list[Any]]:
+        seen, spread = _visited(size)
+        for start in states:
+            if not _mark(seen, start):
+                continue
+            component = frontier = [start]
+            while frontier := spread(frontier, expand, seen):
+                component += frontier
+            yield component
+    return UnaryFn(__inner)
+
+def _visited(size: int | None) -> tuple[set | bytearray, Callable[[list, Callable[[Any], Iterable], Any], list]]:
+    """Return empty visited set (or bitmap of `size`) and function spreading to unvisited neighbours"""
+    if size is None:
+        return set(), _spread
+    return bytearray(size), _spread_bitmap
+
+def _mark(seen: set | bytearray, state: Hashable) -> bool:
+    """Mark `state` visited returning whether it was not visited before"""
+    if isinstance(seen, bytearray):
+        if not 0 <= state < len(seen):
+            raise _outside(state, len(seen))
+        if seen[state]:
+            return False
+        seen[state] = 1
+    elif state in seen:
+        return False
+    else:
+        seen.add(state)
+    return True
+
+def _spread(frontier: list, expand: Callable[[Any], Iterable], seen: set) -> list:
+    """Return unvisited neighbours of `frontier` states marking them visited"""
+    following = []
+    for state in frontier:
+        for neighbour in expand(state):
+            if neighbour not in seen:
+                seen.add(neighbour)
+                following.append(neighbour)
+    return following
+
+def _spread_bitmap(frontier: list, expand: Callable[[Any], Iterable], seen: bytearray) -> list:
+    """Return unvisited neighbours of `frontier` states marking them in bitmap of integer states below its length"""
+    following, size = [], len(seen)
+    for state in frontier:
+        for neighbour in expand(state):
+            if not 0 <= neighbour < size:
+                raise _outside(neighbour, size)
+            if not seen[neighbour]:
+                seen[neighbour] = 1
+                following.append(neighbour)
+    return following
+
+def _goal(goal: Any) -> Callable[[Any], bool] | None:
+    if goal is None or callable(goal):
+        return goal
+    return functools.partial(operator.eq, goal)
+
+def _edges(neighbours: Callable[[Any], Iterable] | Mapping, cost: Callable[[Any, Any], Any] | None) -> Callable[[Any], Iterable]:
+    """Return function listing (state, cost) pairs of edges leaving a state"""
+    expand = _callable(neighbours)
+    if cost is None:
+        return expand
+    weigh = _callable(cost)
+    return lambda state: [(neighbour, weigh(state, neighbour)) for neighbour in expand(state)]
+
+def _best_first(start: Hashable, edges: Callable[[Any], Iterable], estimate: Callable[[Any], Any] | None, reached: Callable[[Any], bool] | None) -> Iterator[tuple[Any, Any]]:
+    """Yield states settled in order of distance (plus `estimate` of remaining one) skipping stale heap entries"""
+    best = {start: 0}
+    order = itertools.count()
+    heap = [(estimate(start) if estimate else 0, 0, next(order), start)]
+    while heap:
+        _, distance, _, state = heapq.heappop(heap)
+        if distance > best[state]:
+            continue
+        yield state, distance
+        if reached is not None and reached(state):
+            return
+        for neighbour, step in edges(state):
+            total = distance + step
+            if neighbour not in best or total < best[neighbour]:
+                best[neighbour] = total
+                heapq.heappush(heap, (total + estimate(neighbour) if estimate else total, total, next(order), neighbour))
+
+def _layer(frontier: list, expand: Callable[[Any], Iterable], parents: dict, others: dict) -> tuple[list, Any]:
+    """Expand one breadth-first layer recording parents, stopping at the first state already reached from the other end"""
+    following = []
+    for state in frontier:
+        for neighbour in expand(state):
+            if neighbour not in parents:
+                parents[neighbour] = state
+                if neighbour in others:
+                    return following, neighbour
+                following.append(neighbour)
+    return following, None
+
+def _walk(state: Any, parents: dict) -> list[Any]:
+    path = []
+    while state is not None:
+        path.append(state)
+        state = parents[state]
+    return path
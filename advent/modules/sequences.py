@@ -1,23 +1,44 @@
+import asyncio
 import builtins
 import collections
+import concurrent.futures
 import functools
+import heapq
+import inspect
 import itertools
+import math
 import operator
+import os
+import time
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Reversible, Sequence
-from functools import cmp_to_key
+from collections.abc import AsyncIterable, AsyncIterator, Hashable, Iterable, Mapping, Reversible, Sequence
 from typing import Any, Callable, Sized
 
-from ..classes import UnaryFn
+from ..classes import AnyFn, BinaryFn, BloomFilter, HyperLogLog, LazySequence, Outcome, Pipeline, UnaryFn, stage
+from . import operators
+
+try:
+    import numpy
+    _ARRAY = numpy.ndarray
+except ImportError:
+    numpy = None
+    _ARRAY = ()
 
 __all__ = [
     'map',
+    'pmap',
+    'tmap',
+    'fan_out',
+    'amap',
+    'acollect',
     'filter',
     'filter_not',
     'partition',
     'padded_partition',
     'split_every',
     'group_by',
+    'aggregate_by',
+    'frequencies',
     'take',
     'take_every',
     'take_while',
@@ -26,8 +47,16 @@ __all__ = [
     'drop_while',
     'compress',
     'distinct',
+    'count_distinct',
+    'union',
+    'intersect',
+    'difference',
     'sort_by',
     'sort_with',
+    'top_k',
+    'bottom_k',
+    'nth_smallest',
+    'merge_sorted',
     'reverse',
     'cycle',
     'enumerate',
@@ -54,6 +83,8 @@ __all__ = [
     'first',
     'last',
     'pick',
+    'find_cycle',
+    'nth_state',
     'head',
     'tail',
     'edges',
@@ -64,34 +95,115 @@ __all__ = [
     'sliding_filter_not',
     'sliding_reduce',
     'sliding_scan',
+    'sliding_sum',
+    'sliding_product',
+    'sliding_count',
+    'sliding_min',
+    'sliding_max',
+    'sliding_distinct',
     'permutations',
     'combinations',
+    'product_of',
+    'subsets',
+    'rank_permutation',
+    'unrank_permutation',
+    'rank_combination',
+    'unrank_combination',
+    'lazy',
+    'to_array',
+    'fuse',
 ]
 
 _UNDEFINED = object()
 
+_EXACT_LIMIT = 2 ** 62
+
+@stage
 def map(mapper: Callable[[Any], Any] | Mapping) -> UnaryFn:
     """Apply `mapper` to each element"""
-    if callable(mapper):
-        def __inner(arg: Iterable):
-            return builtins.map(mapper, arg)
-    else:
-        def __inner(arg: Iterable):
-            return builtins.map(lambda item: mapper[item], arg)
+    vector, fn = _array_fn(mapper, 1), _callable(mapper)
+    def __inner(arg: Iterable):
+        if isinstance(arg, LazySequence):
+            return arg.map(fn)
+        if vector is not None and isinstance(arg, _ARRAY):
+            return vector(arg)
+        return builtins.map(fn, arg)
+    return UnaryFn(__inner)
+
+@stage
+def pmap(mapper: Callable[[Any], Any], workers: int | None = None, chunksize: int = 64, ordered: bool = True) -> UnaryFn:
+    """Apply `mapper` to each element on a pool of `workers` processes, sending elements in chunks of `chunksize`"""
+    def __inner(arg: Iterable):
+        executor = concurrent.futures.ProcessPoolExecutor(workers, initializer=_set_pool_mapper, initargs=(mapper,))
+        return _pooled(executor, _map_pool_chunk, arg, chunksize, ordered, workers)
+    return UnaryFn(__inner)
+
+@stage
+def tmap(mapper: Callable[[Any], Any], workers: int | None = None, chunksize: int = 1, ordered: bool = True) -> UnaryFn:
+    """Apply `mapper` to each element on a pool of `workers` threads, sending elements in chunks of `chunksize`"""
+    def __inner(arg: Iterable):
+        executor = concurrent.futures.ThreadPoolExecutor(workers)
+        return _pooled(executor, functools.partial(_map_chunk, mapper), arg, chunksize, ordered, workers)
+    return UnaryFn(__inner)
+
+@stage
+def fan_out(solver: Callable[[Any], Any], workers: int | None = None, threads: bool = False, ordered: bool = True) -> UnaryFn:
+    """Run `solver` on each input in parallel yielding its `Outcome`"""
+    def __inner(arg: Iterable | Mapping):
+        pairs = arg.items() if isinstance(arg, Mapping) else builtins.enumerate(arg)
+        if threads:
+            executor = concurrent.futures.ThreadPoolExecutor(workers)
+            return _pooled(executor, functools.partial(_map_chunk, functools.partial(_outcome, solver)), pairs, 1, ordered, workers)
+        executor = concurrent.futures.ProcessPoolExecutor(workers, initializer=_set_pool_mapper, initargs=(functools.partial(_outcome, solver),))
+        return _pooled(executor, _map_pool_chunk, pairs, 1, ordered, workers)
+    return UnaryFn(__inner)
+
+@stage
+def amap(mapper: Callable[[Any], Any], concurrency: int = 8) -> UnaryFn:
+    """Apply coroutine function `mapper` to each element with at most `concurrency` calls in flight"""
+    fn = _callable(mapper)
+    async def __inner(arg: Iterable | AsyncIterable) -> AsyncIterator:
+        pending = collections.deque()
+        try:
+            async for item in _asynchronous(arg):
+                pending.append(_future(fn(item)))
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
     return UnaryFn(__inner)
 
+@stage
+def acollect() -> UnaryFn:
+    """Return awaitable list of elements of (async) iterable"""
+    async def __inner(arg: Iterable | AsyncIterable) -> list:
+        return [item async for item in _asynchronous(arg)]
+    return UnaryFn(__inner)
+
+@stage
 def filter(predicate: Callable[[Any], bool]) -> UnaryFn:
     """Keep elements for which `predicate` returns true"""
-    def __inner(arg: Iterable):
-        return builtins.filter(predicate, arg)
+    if (vector := _array_fn(predicate, 1)) is not None:
+        def __inner(arg: Iterable):
+            if isinstance(arg, _ARRAY) and arg.ndim == 1:
+                return arg[numpy.asarray(vector(arg), dtype=bool)]
+            return builtins.filter(predicate, arg)
+    else:
+        def __inner(arg: Iterable):
+            return builtins.filter(predicate, arg)
     return UnaryFn(__inner)
 
+@stage
 def filter_not(predicate: Callable[[Any], bool]) -> UnaryFn:
     """Keep elements for which `predicate` returns false"""
     def __inner(arg: Iterable):
         return itertools.filterfalse(predicate, arg)
     return UnaryFn(__inner)
 
+@stage
 def partition(size: int) -> UnaryFn:
     """Return elements in groups of given `size`, discard extra elements"""
     def __inner(arg: Iterable):
@@ -99,6 +211,7 @@ def partition(size: int) -> UnaryFn:
         return zip(*its)
     return UnaryFn(__inner)
 
+@stage
 def padded_partition(size: int, fill_value: Any = None) -> UnaryFn:
     """Return elements in groups of given `size`, fill missing elements with `fill_value`"""
     def __inner(arg: Iterable):
@@ -106,6 +219,7 @@ def padded_partition(size: int, fill_value: Any = None) -> UnaryFn:
         return itertools.zip_longest(*its, fillvalue=fill_value)
     return UnaryFn(__inner)
 
+@stage
 def split_every(size: int) -> UnaryFn:
     """Return elements in groups of given `size`, return remaining elements in smaller group"""
     def __inner(arg: Iterable):
@@ -114,6 +228,7 @@ def split_every(size: int) -> UnaryFn:
             yield piece
     return UnaryFn(__inner)
 
+@stage
 def group_by(selector: Callable[[Any], Any]) -> UnaryFn:
     """Return elements in groups for which `selector` returns the same value"""
     def __inner(arg: Iterable):
@@ -124,30 +239,75 @@ def group_by(selector: Callable[[Any], Any]) -> UnaryFn:
             yield tuple(item)
     return UnaryFn(__inner)
 
+@stage
+def aggregate_by(selector: Callable[[Any], Any], reducer: Callable[..., Any] | Mapping[str, Callable[..., Any]], value: Callable[[Any], Any] | None = None, presorted: bool = False) -> UnaryFn:
+    """Return (key, aggregate) pairs of elements grouped by `selector` and folded in one pass by `reducer`"""
+    key, extract = _callable(selector), None if value is None else _callable(value)
+    start, combine, finish = _aggregator(reducer)
+    def __inner(arg: Iterable):
+        if presorted:
+            for k, group in itertools.groupby(arg, key):
+                if extract is not None:
+                    group = builtins.map(extract, group)
+                yield k, finish(functools.reduce(combine, group, start(next(group))))
+            return
+        if reducer is builtins.len:
+            yield from collections.Counter(builtins.map(key, arg)).items()
+            return
+        results = {}
+        for item in arg:
+            k = key(item)
+            if extract is not None:
+                item = extract(item)
+            if k in results:
+                results[k] = combine(results[k], item)
+            else:
+                results[k] = start(item)
+        for k, result in results.items():
+            yield k, finish(result)
+    return UnaryFn(__inner)
+
+@stage
+def frequencies(selector: Callable[[Any], Any] | None = None) -> UnaryFn:
+    """Return `collections.Counter` of elements (or values of `selector` for them)"""
+    key = None if selector is None else _callable(selector)
+    def __inner(arg: Iterable):
+        return collections.Counter(arg if key is None else builtins.map(key, arg))
+    return UnaryFn(__inner)
+
+@stage
 def take(count: int) -> UnaryFn:
     """Return first `count` elements"""
     def __inner(arg: Iterable):
+        if isinstance(arg, LazySequence):
+            return arg[:count]
         return itertools.islice(arg, count)
     return UnaryFn(__inner)
 
+@stage
 def take_every(step: int) -> UnaryFn:
     """Return every Nth element starting from the Nth"""
     def __inner(arg: Iterable):
-        for i, item in builtins.enumerate(arg, 1):
-            if i % step == 0:
-                yield item
+        if isinstance(arg, LazySequence):
+            return arg[step - 1::step]
+        return (item for i, item in builtins.enumerate(arg, 1) if i % step == 0)
     return UnaryFn(__inner)
 
+@stage
 def take_while(predicate: Callable[[Any], bool]) -> UnaryFn:
     """Take elements from the start while predicate evaluates to True"""
     return UnaryFn(lambda arg: itertools.takewhile(predicate, arg))
 
+@stage
 def drop(count: int) -> UnaryFn:
     """Return all but first `count` elements"""
     def __inner(arg: Iterable):
+        if isinstance(arg, LazySequence):
+            return arg[count:]
         return itertools.islice(arg, count, None)
     return UnaryFn(__inner)
 
+@stage
 def drop_every(step: int) -> UnaryFn:
     """Return elements excluding every Nth element"""
     def __inner(arg: Iterable):
@@ -156,86 +316,248 @@ def drop_every(step: int) -> UnaryFn:
                 yield item
     return UnaryFn(__inner)
 
+@stage
 def drop_while(predicate: Callable[[Any], bool]) -> UnaryFn:
     """Drop elements from the start while predicate evaluates to True"""
     return UnaryFn(lambda arg: itertools.dropwhile(predicate, arg))
 
+@stage
 def compress(mask: Iterable[bool]) -> UnaryFn:
     """Filter elements where corresponding value in `mask` is True"""
     return UnaryFn(lambda arg: itertools.compress(arg, mask))
 
-def distinct() -> UnaryFn:
-    """Return distinct (unique) elements preserving order"""
+@stage
+def distinct(size: int | None = None, capacity: int | None = None, error_rate: float = 0.01) -> UnaryFn:
+    """Return distinct (unique) elements, tracked in bitmap of integers below `size` or Bloom filter of `capacity`"""
     def __inner(arg: Iterable):
-        cache = set()
+        if size is not None:
+            seen = bytearray(size)
+            for item in arg:
+                if not 0 <= item < size:
+                    raise _outside(item, size)
+                if not seen[item]:
+                    seen[item] = 1
+                    yield item
+        elif capacity is not None:
+            yield from builtins.filter(BloomFilter(capacity, error_rate).add, arg)
+        else:
+            cache = set()
+            for item in arg:
+                if item not in cache:
+                    cache.add(item)
+                    yield item
+    return UnaryFn(__inner)
+
+@stage
+def count_distinct(size: int | None = None, precision: int | None = None) -> UnaryFn:
+    """Return number of distinct elements, estimated by HyperLogLog if `precision` is given"""
+    def __inner(arg: Iterable):
+        if size is not None:
+            seen = bytearray(size)
+            for item in arg:
+                if not 0 <= item < size:
+                    raise _outside(item, size)
+                seen[item] = 1
+            return size - seen.count(0)
+        if precision is not None:
+            sketch = HyperLogLog(precision)
+            for item in arg:
+                sketch.add(item)
+            return len(sketch)
+        return len(set(arg))
+    return UnaryFn(__inner)
+
+@stage
+def union(*others: Iterable, size: int | None = None) -> UnaryFn:
+    """Return distinct elements of the iterable followed by new ones of `others` (see `distinct` for `size`)"""
+    unique = distinct(size).fn
+    def __inner(arg: Iterable):
+        return unique(itertools.chain(arg, *others))
+    return UnaryFn(__inner)
+
+@stage
+def intersect(*others: Iterable, size: int | None = None) -> UnaryFn:
+    """Return distinct elements of the iterable present in all (if any) of `others`"""
+    unique = distinct(size).fn
+    def __inner(arg: Iterable):
+        if not others:
+            yield from unique(arg)
+            return
+        if size is None:
+            common = set(others[0])
+            for other in others[1:]:
+                if not common:
+                    return
+                common.intersection_update(other)
+            for item in arg:
+                if item in common:
+                    common.discard(item)
+                    yield item
+            return
+        common = None
+        for other in others:
+            present = bytearray(size)
+            for item in other:
+                if not 0 <= item < size:
+                    raise _outside(item, size)
+                present[item] = 1
+            common = present if common is None else bytearray((int.from_bytes(common, 'little') & int.from_bytes(present, 'little')).to_bytes(size, 'little'))
+            if 1 not in common:
+                return
         for item in arg:
-            if item not in cache:
-                cache.add(item)
+            if not 0 <= item < size:
+                raise _outside(item, size)
+            if common[item]:
+                common[item] = 0
                 yield item
     return UnaryFn(__inner)
 
+@stage
+def difference(*others: Iterable, size: int | None = None) -> UnaryFn:
+    """Return distinct elements of the iterable present in none of `others` (see `distinct` for `size`)"""
+    def __inner(arg: Iterable):
+        if size is None:
+            excluded = set().union(*others)
+            for item in arg:
+                if item not in excluded:
+                    excluded.add(item)
+                    yield item
+            return
+        excluded = bytearray(size)
+        for other in others:
+            for item in other:
+                if not 0 <= item < size:
+                    raise _outside(item, size)
+                excluded[item] = 1
+        for item in arg:
+            if not 0 <= item < size:
+                raise _outside(item, size)
+            if not excluded[item]:
+                excluded[item] = 1
+                yield item
+    return UnaryFn(__inner)
+
+@stage
 def sort_by(key_fn: Callable[[Any], Any] = lambda x: x) -> UnaryFn:
     """Sort iterable using a key extraction function"""
     return UnaryFn(lambda iterable: sorted(iterable, key=key_fn))
 
+@stage
 def sort_with(comparator: Callable[[Any, Any], bool]) -> UnaryFn:
     """Sort iterable using a binary boolean predicate comparator"""
-    key = cmp_to_key(lambda a, b: -1 if comparator(a, b) else (1 if comparator(b, a) else 0))
-    return UnaryFn(lambda iterable: sorted(iterable, key=key))
+    precedes = _callable(comparator)
+    return UnaryFn(lambda iterable: [ordered.item for ordered in sorted(_Ordered(item, precedes) for item in iterable)])
+
+@stage
+def top_k(count: int, key_fn: Callable[[Any], Any] | None = None) -> UnaryFn:
+    """Return `count` largest elements (by `key_fn`) in descending order"""
+    def __inner(arg: Iterable):
+        return heapq.nlargest(count, arg, key=key_fn)
+    return UnaryFn(__inner)
+
+@stage
+def bottom_k(count: int, key_fn: Callable[[Any], Any] | None = None) -> UnaryFn:
+    """Return `count` smallest elements (by `key_fn`) in ascending order"""
+    def __inner(arg: Iterable):
+        return heapq.nsmallest(count, arg, key=key_fn)
+    return UnaryFn(__inner)
+
+@stage
+def nth_smallest(n: int, key_fn: Callable[[Any], Any] | None = None) -> UnaryFn:
+    """Return element at index `n` of elements sorted (by `key_fn`) found by quickselect in expected linear time"""
+    def __inner(arg: Iterable):
+        items = list(arg)
+        if not -len(items) <= n < len(items):
+            return None
+        index = n % len(items)
+        if key_fn is None:
+            return _select(items, index)
+        keys = list(builtins.map(key_fn, items))
+        selected = _select(keys, index)
+        rank = index - builtins.sum(1 for k in keys if k < selected)
+        return next(itertools.islice((item for item, k in builtins.zip(items, keys) if k == selected), rank, None))
+    return UnaryFn(__inner)
+
+@stage
+def merge_sorted(key_fn: Callable[[Any], Any] | None = None, reverse: bool = False) -> UnaryFn:
+    """Return elements of sorted iterables merged lazily into single sorted iterator"""
+    def __inner(arg: Iterable[Iterable]):
+        return heapq.merge(*arg, key=key_fn, reverse=reverse)
+    return UnaryFn(__inner)
 
+@stage
 def reverse() -> UnaryFn:
     """Return elements in reversed order"""
     def __inner(arg: Reversible):
+        if isinstance(arg, LazySequence):
+            return arg[::-1]
         try:
             return builtins.reversed(arg)
         except TypeError:
             return builtins.reversed(list(arg))
     return UnaryFn(__inner)
 
+@stage
 def cycle() -> UnaryFn:
     """Return elements indefinitely"""
     def __inner(arg: Iterable):
         return itertools.cycle(arg)
     return UnaryFn(__inner)
 
+@stage
 def enumerate(start: int = 0) -> UnaryFn:
     """Return (index, element) pair for each element"""
     def __inner(arg: Iterable):
         return builtins.enumerate(arg, start)
     return UnaryFn(__inner)
 
+@stage
 def reduce(reducer: Callable[[Any, Any], Any], init: Any = _UNDEFINED) -> UnaryFn:
     """Reduce all elements with `reducer` and optional `init` value"""
+    ufunc = _array_reducer(reducer)
     def __inner(arg: Iterable):
+        if isinstance(arg, _ARRAY) and arg.ndim == 1:
+            if ufunc is not None and (values := _reducible(ufunc, arg, init)) is not None:
+                return ufunc.reduce(values)
+            arg = arg.tolist()
         if init is _UNDEFINED:
             return functools.reduce(reducer, arg)
         return functools.reduce(reducer, arg, init)
     return UnaryFn(__inner)
 
+@stage
 def scan(reducer: Callable[[Any, Any], Any], init: Any = _UNDEFINED) -> UnaryFn:
     """Reduce each prefix with `reducer` and optional `init` value"""
+    ufunc = _array_reducer(reducer)
     def __inner(arg: Iterable):
+        if isinstance(arg, _ARRAY) and arg.ndim == 1:
+            if ufunc is not None and (values := _reducible(ufunc, arg, init)) is not None:
+                return ufunc.accumulate(values)
+            arg = arg.tolist()
         if init is _UNDEFINED:
             return itertools.accumulate(arg, reducer)
         return itertools.accumulate(arg, reducer, initial=init)
     return UnaryFn(__inner)
 
+@stage
 def prefixes() -> UnaryFn:
-    """Return all non-empty prefixes"""
+    """Return all non-empty prefixes (slice views of `lazy` sequence)"""
     def __inner(arg: Iterable):
-        seq = tuple(arg)
+        seq = arg if isinstance(arg, LazySequence) else tuple(arg)
         for size in builtins.range(1, len(seq) + 1):
             yield seq[:size]
     return UnaryFn(__inner)
 
+@stage
 def suffixes() -> UnaryFn:
-    """Return all non-empty suffixes"""
+    """Return all non-empty suffixes (slice views of `lazy` sequence)"""
     def __inner(arg: Iterable):
-        seq = tuple(arg)
+        seq = arg if isinstance(arg, LazySequence) else tuple(arg)
         for i in builtins.range(len(seq)):
             yield seq[i:]
     return UnaryFn(__inner)
 
+@stage
 def replicate(mask: Iterable[int]) -> UnaryFn:
     """Replicate each element in sequence by corresponding count in `mask`"""
     def __inner(arg: Iterable):
@@ -246,30 +568,35 @@ def replicate(mask: Iterable[int]) -> UnaryFn:
                 yield item
     return UnaryFn(__inner)
 
+@stage
 def contains(value: Any) -> UnaryFn:
     """Check whether sequence contains given `value`"""
     def __inner(arg: Iterable):
         return builtins.any(value == item for item in arg)
     return UnaryFn(__inner)
 
+@stage
 def contains_if(predicate: Callable[[Any], bool]) -> UnaryFn:
     """Check whether sequence contains an element satisfying `predicate`"""
     def __inner(arg: Iterable):
         return builtins.any(predicate(item) for item in arg)
     return UnaryFn(__inner)
 
+@stage
 def count(value: Any) -> UnaryFn:
     """Return number of elements that are equal to given `value`"""
     def __inner(arg: Iterable):
         return builtins.sum(1 for item in arg if item == value)
     return UnaryFn(__inner)
 
+@stage
 def count_if(predicate: Callable[[Any], bool]) -> UnaryFn:
     """Return number of elements that satisfy given `predicate`"""
     def __inner(arg: Iterable):
         return builtins.sum(1 for item in arg if predicate(item))
     return UnaryFn(__inner)
 
+@stage
 def index(value: Any, invalid_idx: Any = -1) -> UnaryFn:
     """Return index of the first element that is equal to given `value`, `invalid_idx` otherwise"""
     def __inner(arg: Iterable):
@@ -279,6 +606,7 @@ def index(value: Any, invalid_idx: Any = -1) -> UnaryFn:
         return invalid_idx
     return UnaryFn(__inner)
 
+@stage
 def index_if(predicate: Callable[[Any], bool], invalid_idx: Any = -1) -> UnaryFn:
     """Return index of the first element that satisfies given `predicate`, `invalid_idx` otherwise"""
     def __inner(arg: Iterable):
@@ -288,6 +616,7 @@ def index_if(predicate: Callable[[Any], bool], invalid_idx: Any = -1) -> UnaryFn
         return invalid_idx
     return UnaryFn(__inner)
 
+@stage
 def indices(value: Any) -> UnaryFn:
     """Return indices of all elements that are equal to given `value`"""
     def __inner(arg: Iterable):
@@ -296,6 +625,7 @@ def indices(value: Any) -> UnaryFn:
                 yield i
     return UnaryFn(__inner)
 
+@stage
 def indices_if(predicate: Callable[[Any], bool]) -> UnaryFn:
     """Return indices of all elements that satisfy given `predicate`"""
     def __inner(arg: Iterable):
@@ -304,44 +634,56 @@ def indices_if(predicate: Callable[[Any], bool]) -> UnaryFn:
                 yield i
     return UnaryFn(__inner)
 
+@stage
 def sum(init: int = 0) -> UnaryFn:
     """Return sum of all elements with optional `init` value"""
     return reduce(operator.add, init)
 
+@stage
 def product(init: int = 1) -> UnaryFn:
     """Return product of all elements with optional `init` value"""
     return reduce(operator.mul, init)
 
+@stage
 def min() -> UnaryFn:
     """Return minimum element"""
     def __inner(arg: Iterable):
+        if isinstance(arg, _ARRAY) and arg.ndim == 1:
+            return arg.min()
         return builtins.min(arg)
     return UnaryFn(__inner)
 
+@stage
 def max() -> UnaryFn:
     """Return maximum element"""
     def __inner(arg: Iterable):
+        if isinstance(arg, _ARRAY) and arg.ndim == 1:
+            return arg.max()
         return builtins.max(arg)
     return UnaryFn(__inner)
 
+@stage
 def all() -> UnaryFn:
     """Return true if all elements are truthy"""
     def __inner(arg: Iterable):
         return builtins.all(arg)
     return UnaryFn(__inner)
 
+@stage
 def any() -> UnaryFn:
     """Return true if any element is truthy"""
     def __inner(arg: Iterable):
         return builtins.any(arg)
     return UnaryFn(__inner)
 
+@stage
 def none() -> UnaryFn:
     """Return true if no elements are truthy"""
     def __inner(arg: Iterable):
         return not builtins.any(arg)
     return UnaryFn(__inner)
 
+@stage
 def first() -> UnaryFn:
     """Return first element"""
     def __inner(arg: Iterable | Sequence):
@@ -353,6 +695,7 @@ def first() -> UnaryFn:
             return None
     return UnaryFn(__inner)
 
+@stage
 def last() -> UnaryFn:
     """Return last element"""
     def __inner(arg: Iterable | Sequence):
@@ -365,6 +708,7 @@ def last() -> UnaryFn:
             return item
     return UnaryFn(__inner)
 
+@stage
 def pick(idx: int) -> UnaryFn:
     """Return `idx` (nth) element"""
     def __inner(arg: Iterable | Sequence):
@@ -377,16 +721,49 @@ def pick(idx: int) -> UnaryFn:
             return None
     return UnaryFn(__inner)
 
+@stage
+def find_cycle(key: Callable[[Any], Hashable] | None = None) -> UnaryFn:
+    """Return (start, period) of the first repetition of elements (compared by `key`), or None if elements never repeat"""
+    def __inner(arg: Iterable):
+        seen = {}
+        for i, v in builtins.enumerate(arg):
+            k = v if key is None else key(v)
+            if k in seen:
+                return seen[k], i - seen[k]
+            seen[k] = i
+        return None
+    return UnaryFn(__inner)
+
+@stage
+def nth_state(n: int, key: Callable[[Any], Hashable] | None = None) -> UnaryFn:
+    """Return `n`th element of sequence of states, jumping ahead once states (compared by `key`) start repeating"""
+    def __inner(arg: Iterable):
+        seen, states = {}, []
+        for i, v in builtins.enumerate(arg):
+            if i == n:
+                return v
+            k = v if key is None else key(v)
+            if k in seen:
+                start = seen[k]
+                return states[start + (n - start) % (i - start)]
+            seen[k] = i
+            states.append(v)
+        return None
+    return UnaryFn(__inner)
+
+@stage
 def head() -> UnaryFn:
     """Return head (first) element"""
     return first()
 
+@stage
 def tail() -> UnaryFn:
     """Return tail (all but first) elements"""
     def __inner(arg: Iterable):
         return itertools.islice(arg, 1, None)
     return UnaryFn(__inner)
 
+@stage
 def edges() -> UnaryFn:
     """Return tuple of (first, last) elements"""
     def __inner(arg: Iterable | Sequence):
@@ -403,6 +780,7 @@ def edges() -> UnaryFn:
             return first_item, last_item
     return UnaryFn(__inner)
 
+@stage
 def tally() -> UnaryFn:
     """Return tally (element count)"""
     def __inner(arg: Iterable | Sized):
@@ -412,46 +790,614 @@ def tally() -> UnaryFn:
             return builtins.sum(1 for _ in arg)
     return UnaryFn(__inner)
 
-def sliding(size: int) -> UnaryFn:
-    """Return sliding windows of given `size`"""
+@stage
+def sliding(size: int, view: bool = False) -> UnaryFn:
+    """Return sliding windows of given `size` (or single deque updated in place if `view`)"""
     def __inner(arg: Iterable):
         it = iter(arg)
         window = collections.deque(itertools.islice(it, size), maxlen=size)
         if len(window) == size:
+            if view:
+                yield window
+                for item in it:
+                    window.append(item)
+                    yield window
+                return
             yield tuple(window)
             for item in it:
                 window.append(item)
                 yield tuple(window)
     return UnaryFn(__inner)
 
-def sliding_map(size: int, mapper: Callable[[Any], Any]) -> UnaryFn:
+@stage
+def sliding_map(size: int, mapper: Callable[[Any], Any], view: bool = False) -> UnaryFn:
     """Return `sliding` combined with `map`"""
-    return sliding(size) | map(mapper)
+    return sliding(size, view) | map(mapper)
 
+@stage
 def sliding_filter(size: int, predicate: Callable[[Any], bool]) -> UnaryFn:
     """Return `sliding_map` combined with `filter`"""
     return sliding_map(size, filter(predicate))
 
+@stage
 def sliding_filter_not(size: int, predicate: Callable[[Any], bool]) -> UnaryFn:
     """Return `sliding_map` combined with `filter_not`"""
     return sliding_map(size, filter_not(predicate))
 
-def sliding_reduce(size: int, reducer: Callable[[Any, Any], Any]) -> UnaryFn:
-    """Return `sliding_map` combined with `reduce`"""
-    return sliding_map(size, reduce(reducer))
+@stage
+def sliding_reduce(size: int, reducer: Callable[[Any, Any], Any], inverse: Callable[[Any, Any], Any] | None = None) -> UnaryFn:
+    """Return `sliding_map` combined with `reduce`, updated in O(1) per element given `inverse`"""
+    ufunc = _array_reducer(reducer)
+    python = sliding_map(size, reduce(reducer)) if inverse is None else _sliding_inverse(size, reducer, inverse)
+    if ufunc is None:
+        return python
+    def __inner(arg: Iterable):
+        if not isinstance(arg, _ARRAY) or arg.ndim != 1:
+            return python(arg)
+        if arg.size < size:
+            return arg[:0]
+        if ufunc is numpy.add and arg.dtype.kind in 'iub':
+            if size * builtins.max(builtins.abs(int(arg.min())), builtins.abs(int(arg.max()))) >= _EXACT_LIMIT:
+                return python(arg.tolist())
+            sums = numpy.cumsum(arg, dtype=numpy.uint64 if arg.dtype.kind == 'u' else numpy.int64)
+            return numpy.concatenate((sums[size - 1:size], sums[size:] - sums[:-size]))
+        if (values := _reducible(ufunc, arg, _UNDEFINED)) is None:
+            return python(arg.tolist())
+        windows = numpy.lib.stride_tricks.sliding_window_view(values, size)
+        return ufunc.reduce(windows, axis=-1)
+    return UnaryFn(__inner)
 
+@stage
 def sliding_scan(size: int, reducer: Callable[[Any, Any], Any]) -> UnaryFn:
     """Return `sliding_map` combined with `scan`"""
     return sliding_map(size, scan(reducer))
 
-def permutations(size: int) -> UnaryFn:
-    """Return permutations of elements of given `size`"""
+@stage
+def sliding_sum(size: int) -> UnaryFn:
+    """Return sums of sliding windows of given `size` updated per element in O(1)"""
+    return sliding_reduce(size, operators.add, operators.sub)
+
+@stage
+def sliding_product(size: int) -> UnaryFn:
+    """Return products of sliding windows of given `size` updated per element in amortized O(1)"""
     def __inner(arg: Iterable):
-        return itertools.permutations(arg, size)
+        return _sliding_fold(arg, size, operator.mul)
     return UnaryFn(__inner)
 
-def combinations(size: int) -> UnaryFn:
-    """Return combinations of elements of given `size`"""
+@stage
+def sliding_count(size: int, predicate: Callable[[Any], bool]) -> UnaryFn:
+    """Return numbers of elements satisfying `predicate` in sliding windows of given `size` updated per element in O(1)"""
+    test = _callable(predicate)
     def __inner(arg: Iterable):
-        return itertools.combinations(arg, size)
+        return _running_sums(builtins.map(bool, builtins.map(test, arg)), size)
     return UnaryFn(__inner)
+
+@stage
+def sliding_min(size: int) -> UnaryFn:
+    """Return minimums of sliding windows of given `size` kept in monotonic deque (amortized O(1) per element)"""
+    return _sliding_extremum(size, operator.ge)
+
+@stage
+def sliding_max(size: int) -> UnaryFn:
+    """Return maximums of sliding windows of given `size` kept in monotonic deque (amortized O(1) per element)"""
+    return _sliding_extremum(size, operator.le)
+
+@stage
+def sliding_distinct(size: int) -> UnaryFn:
+    """Return numbers of distinct elements in sliding windows of given `size` updated per element in O(1)"""
+    def __inner(arg: Iterable):
+        lagging, leading = itertools.tee(arg)
+        window = list(itertools.islice(leading, size))
+        if len(window) < size:
+            return
+        counts = {}
+        for v in window:
+            counts[v] = counts.get(v, 0) + 1
+        yield len(counts)
+        for old, new in builtins.zip(lagging, leading):
+            counts[new] = counts.get(new, 0) + 1
+            if counts[old] == 1:
+                del counts[old]
+            else:
+                counts[old] -= 1
+            yield len(counts)
+    return UnaryFn(__inner)
+
+@stage
+def permutations(size: int, prune: Callable[[tuple], bool] | None = None) -> UnaryFn:
+    """Return permutations of elements of given `size`, skipping those extending a prefix `prune` rejects"""
+    def __inner(arg: Iterable):
+        if prune is None:
+            return itertools.permutations(arg, size)
+        return _pruned_permutations(tuple(arg), size, _callable(prune))
+    return UnaryFn(__inner)
+
+@stage
+def combinations(size: int, prune: Callable[[tuple], bool] | None = None) -> UnaryFn:
+    """Return combinations of elements of given `size`, skipping those extending a prefix `prune` rejects"""
+    def __inner(arg: Iterable):
+        if prune is None:
+            return itertools.combinations(arg, size)
+        return _pruned_combinations(tuple(arg), size, _callable(prune))
+    return UnaryFn(__inner)
+
+@stage
+def product_of(repeat: int = 1, prune: Callable[[tuple], bool] | None = None) -> UnaryFn:
+    """Return cartesian product of iterables, skipping tuples extending a prefix `prune` rejects"""
+    def __inner(arg: Iterable[Iterable]):
+        if prune is None:
+            return itertools.product(*arg, repeat=repeat)
+        return _pruned_product(builtins.tuple(builtins.map(tuple, arg)) * repeat, _callable(prune))
+    return UnaryFn(__inner)
+
+@stage
+def subsets(prune: Callable[[tuple], bool] | None = None) -> UnaryFn:
+    """Return all subsets of elements ordered by size, skipping those extending a prefix `prune` rejects"""
+    def __inner(arg: Iterable):
+        items = tuple(arg)
+        if prune is None:
+            return itertools.chain.from_iterable(itertools.combinations(items, size) for size in builtins.range(len(items) + 1))
+        return _pruned_subsets(items, _callable(prune))
+    return UnaryFn(__inner)
+
+@stage
+def rank_permutation(permutation: Iterable) -> UnaryFn:
+    """Return index of `permutation` among `permutations` of its size of the elements"""
+    def __inner(arg: Iterable):
+        items = list(arg)
+        chosen = tuple(permutation)
+        rank, remaining = 0, list(builtins.range(len(items)))
+        for i, item in builtins.enumerate(chosen):
+            position = next((j for j, k in builtins.enumerate(remaining) if items[k] == item), None)
+            if position is None:
+                raise ValueError(f'{item!r} is not available in sequence')
+            rank += position * math.perm(len(items) - i - 1, len(chosen) - i - 1)
+            del remaining[position]
+        return rank
+    return UnaryFn(__inner)
+
+@stage
+def unrank_permutation(index: int, size: int | None = None) -> UnaryFn:
+    """Return permutation of elements of given `size` at `index` of `permutations`"""
+    def __inner(arg: Iterable):
+        remaining = list(arg)
+        count = len(remaining) if size is None else size
+        if not 0 <= index < math.perm(len(remaining), count):
+            return None
+        result, rest = [], index
+        for i in builtins.range(count):
+            position, rest = divmod(rest, math.perm(len(remaining) - 1, count - i - 1))
+            result.append(remaining.pop(position))
+        return tuple(result)
+    return UnaryFn(__inner)
+
+@stage
+def rank_combination(combination: Iterable) -> UnaryFn:
+    """Return index of `combination` among `combinations` of its size of the elements"""
+    def __inner(arg: Iterable):
+        items = list(arg)
+        chosen = tuple(combination)
+        rank, start = 0, 0
+        for i, item in builtins.enumerate(chosen):
+            position = items.index(item, start)
+            left = len(chosen) - i - 1
+            rank += builtins.sum(math.comb(len(items) - j - 1, left) for j in builtins.range(start, position))
+            start = position + 1
+        return rank
+    return UnaryFn(__inner)
+
+@stage
+def unrank_combination(index: int, size: int) -> UnaryFn:
+    """Return combination of elements of given `size` at `index` of `combinations`"""
+    def __inner(arg: Iterable):
+        items = list(arg)
+        if not 0 <= index < math.comb(len(items), size):
+            return None
+        result, rest, position = [], index, 0
+        for left in builtins.range(size - 1, -1, -1):
+            while rest >= (count := math.comb(len(items) - position - 1, left)):
+                rest -= count
+                position += 1
+            result.append(items[position])
+            position += 1
+        return tuple(result)
+    return UnaryFn(__inner)
+
+@stage
+def lazy() -> UnaryFn:
+    """Return elements as `LazySequence` keeping length and random access through following stages"""
+    def __inner(arg: Iterable):
+        if isinstance(arg, LazySequence):
+            return arg
+        return LazySequence(arg if isinstance(arg, Sequence) else tuple(arg))
+    return UnaryFn(__inner)
+
+@stage
+def to_array(dtype: Any = None) -> UnaryFn:
+    """Return elements as NumPy array of given `dtype` so that following stages run vectorized"""
+    if numpy is None:
+        raise ModuleNotFoundError('to_array requires NumPy to be installed')
+    def __inner(arg: Iterable):
+        if isinstance(arg, (_ARRAY, Sequence)):
+            return numpy.asarray(arg, dtype)
+        if dtype is not None:
+            return numpy.fromiter(arg, dtype)
+        return numpy.array(list(arg))
+    return UnaryFn(__inner)
+
+def fuse(fn: AnyFn) -> AnyFn:
+    """Return `fn` with adjacent element-wise stages fused into single stages"""
+    stages = fn.stages
+    fused = []
+    for item in stages:
+        fused.append(item)
+        while len(fused) > 1 and (combined := _fuse_pair(fused[-2], fused[-1])) is not None:
+            fused[-2:] = [combined]
+    if len(fused) == len(stages):
+        return fn
+    return fused[0] if len(fused) == 1 else type(fn)(Pipeline(tuple(fused)))
+
+@stage
+def _chain(steps: tuple[tuple[bool, Callable[[Any], Any]], ...]) -> UnaryFn:
+    """Apply `steps` of (is_filter, fn) pairs to each element as a single stage"""
+    unwrapped = tuple((is_filter, _callable(fn)) for is_filter, fn in steps)
+    def __inner(arg: Iterable):
+        for is_filter, fn in unwrapped:
+            if isinstance(arg, LazySequence) and not is_filter:
+                arg = arg.map(fn)
+            else:
+                arg = builtins.filter(fn, arg) if is_filter else builtins.map(fn, arg)
+        return arg
+    return UnaryFn(__inner)
+
+@stage
+def _chain_sum(steps: tuple[tuple[bool, Callable[[Any], Any]], ...], init: Any) -> UnaryFn:
+    """Return sum of elements passed through `_chain` with `init` value"""
+    elements = _chain(steps).fn
+    if isinstance(init, (int, float, complex)):
+        def __inner(arg: Iterable):
+            return builtins.sum(elements(arg), init)
+    else:
+        def __inner(arg: Iterable):
+            return functools.reduce(operator.add, elements(arg), init)
+    return UnaryFn(__inner)
+
+@stage
+def _chain_count_if(steps: tuple[tuple[bool, Callable[[Any], Any]], ...], predicate: Callable[[Any], bool]) -> UnaryFn:
+    """Return number of elements passed through `_chain` that satisfy `predicate`"""
+    elements, test = _chain(steps).fn, _callable(predicate)
+    def __inner(arg: Iterable):
+        return builtins.sum(itertools.compress(itertools.repeat(1), builtins.map(test, elements(arg))))
+    return UnaryFn(__inner)
+
+@stage
+def _chain_extremum(steps: tuple[tuple[bool, Callable[[Any], Any]], ...], extremum: Callable[[Iterable], Any]) -> UnaryFn:
+    """Return `extremum` (`min` or `max`) of elements passed through `_chain`"""
+    elements = _chain(steps).fn
+    def __inner(arg: Iterable):
+        return extremum(elements(arg))
+    return UnaryFn(__inner)
+
+@stage
+def _top(count: int, key_fn: Callable[[Any], Any]) -> UnaryFn:
+    """Return `count` smallest elements by `key_fn` in ascending order"""
+    smallest = bottom_k(count, key_fn).fn
+    def __inner(arg: Iterable):
+        return iter(smallest(arg))
+    return UnaryFn(__inner)
+
+_pool_mapper = None
+
+def _set_pool_mapper(mapper: Callable[[Any], Any]) -> None:
+    global _pool_mapper
+    _pool_mapper = mapper
+
+def _map_pool_chunk(chunk: list) -> list:
+    return list(builtins.map(_pool_mapper, chunk))
+
+def _map_chunk(mapper: Callable[[Any], Any], chunk: list) -> list:
+    return list(builtins.map(mapper, chunk))
+
+def _outcome(solver: Callable[[Any], Any], pair: tuple[Any, Any]) -> Outcome:
+    """Return `Outcome` of `solver` run on value of (key, value) `pair`, capturing raised exception instead of result"""
+    key, value = pair
+    start = time.perf_counter()
+    try:
+        return Outcome(key, solver(value), None, time.perf_counter() - start)
+    except Exception as error:
+        return Outcome(key, None, error, time.perf_counter() - start)
+
+async def _iterate(iterable: Iterable) -> AsyncIterator:
+    for item in iterable:
+        yield item
+
+def _asynchronous(arg: Iterable | AsyncIterable) -> AsyncIterable:
+    return arg if isinstance(arg, AsyncIterable) else _iterate(arg)
+
+def _future(result: Any) -> asyncio.Future:
+    """Return task running awaitable `result` (or already resolved future of plain value)"""
+    if inspect.isawaitable(result):
+        return asyncio.ensure_future(result)
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(result)
+    return future
+
+def _pooled(executor: concurrent.futures.Executor, fn: Callable[[list], list], arg: Iterable, chunksize: int, ordered: bool, workers: int | None):
+    """Yield results of `fn` run by `executor` on chunks of `arg`, keeping at most two chunks per worker in flight"""
+    in_flight = 2 * (workers or os.cpu_count() or 1)
+    it = iter(arg)
+    pending = collections.deque()
+    try:
+        while chunk := list(itertools.islice(it, chunksize)):
+            pending.append(executor.submit(fn, chunk))
+            if len(pending) >= in_flight:
+                yield from _completed(pending, ordered)
+        while pending:
+            yield from _completed(pending, ordered)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def _completed(pending: collections.deque, ordered: bool) -> Iterable:
+    """Remove and return results of the oldest future if `ordered`, of any completed futures otherwise"""
+    if ordered:
+        return pending.popleft().result()
+    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+    return itertools.chain.from_iterable(future.result() for future in done)
+
+def _array_fn(fn: Callable[..., Any] | Mapping, arity: int) -> Callable[..., Any] | None:
+    """Return NumPy counterpart of `fn` taking `arity` arguments, or None if there is none"""
+    vector = operators.vectorized(fn)
+    if vector is None:
+        return None
+    if isinstance(vector, numpy.ufunc):
+        return vector if vector.nin == arity else None
+    return vector if isinstance(fn, UnaryFn if arity == 1 else BinaryFn) else None
+
+def _array_reducer(fn: Callable[[Any, Any], Any]) -> Any:
+    """Return binary NumPy ufunc counterpart of `fn`, or None if there is none"""
+    vector = _array_fn(fn, 2)
+    return vector if vector is not None and isinstance(vector, numpy.ufunc) else None
+
+def _reducible(ufunc: Any, arg: Any, init: Any) -> Any:
+    """Return `arg` prefixed with optional `init` in dtype `ufunc` reduces exactly like Python numbers, or None if it cannot"""
+    if not arg.size:
+        return None
+    try:
+        dtype = arg.dtype if init is _UNDEFINED else numpy.result_type(arg, init)
+        values = arg if init is _UNDEFINED else numpy.concatenate((numpy.asarray([init], dtype), arg.astype(dtype, copy=False)))
+    except (OverflowError, TypeError):
+        return None
+    if dtype.kind not in 'iub':
+        return values
+    if ufunc in (numpy.power, numpy.left_shift, numpy.lcm):
+        return None
+    if ufunc in (numpy.add, numpy.subtract, numpy.multiply):
+        if ufunc is numpy.multiply:
+            exact = numpy.log2(numpy.maximum(numpy.abs(values.astype(numpy.float64)), 1)).sum() < 62
+        else:
+            exact = len(values) * builtins.max(builtins.abs(int(values.min())), builtins.abs(int(values.max()))) < _EXACT_LIMIT
+        return values.astype(numpy.int64, copy=False) if exact else None
+    return values
+
+def _sliding_inverse(size: int, reducer: Callable[[Any, Any], Any], inverse: Callable[[Any, Any], Any]) -> UnaryFn:
+    """Return sliding reductions updating previous result by removing outgoing element with `inverse` and adding incoming one"""
+    combine, remove = _callable(reducer), _callable(inverse)
+    if combine is operator.add and remove is operator.sub:
+        return UnaryFn(lambda arg: _running_sums(arg, size))
+    def __inner(arg: Iterable):
+        lagging, leading = itertools.tee(arg)
+        window = list(itertools.islice(leading, size))
+        if len(window) < size:
+            return
+        result = functools.reduce(combine, window)
+        yield result
+        for old, new in builtins.zip(lagging, leading):
+            result = combine(remove(result, old), new)
+            yield result
+    return UnaryFn(__inner)
+
+def _sliding_fold(arg: Iterable, size: int, combine: Callable[[Any, Any], Any]) -> Iterable:
+    """Yield folds of sliding windows by associative `combine` kept in two stacks, so nothing is ever removed from a result"""
+    front, back, folded = [], [], None
+    for item in arg:
+        folded = combine(folded, item) if back else item
+        back.append(item)
+        if len(front) + len(back) > size:
+            if not front:
+                for value in reversed(back):
+                    front.append(combine(value, front[-1]) if front else value)
+                back.clear()
+            front.pop()
+        if len(front) + len(back) == size:
+            if not back:
+                yield front[-1]
+            elif not front:
+                yield folded
+            else:
+                yield combine(front[-1], folded)
+
+def _running_sums(arg: Iterable, size: int) -> Iterable:
+    """Return sums of sliding windows as running total of incoming minus outgoing elements"""
+    lagging, leading = itertools.tee(arg)
+    window = list(itertools.islice(leading, size))
+    if len(window) < size:
+        return iter(())
+    return itertools.accumulate(builtins.map(operator.sub, leading, lagging), initial=builtins.sum(window))
+
+def _sliding_extremum(size: int, dominated: Callable[[Any, Any], bool]) -> UnaryFn:
+    """Return sliding extremums keeping (index, value) candidates not `dominated` by later elements"""
+    def __inner(arg: Iterable):
+        candidates = collections.deque()
+        for i, v in builtins.enumerate(arg):
+            while candidates and dominated(candidates[-1][1], v):
+                candidates.pop()
+            candidates.append((i, v))
+            if candidates[0][0] <= i - size:
+                candidates.popleft()
+            if i >= size - 1:
+                yield candidates[0][1]
+    return UnaryFn(__inner)
+
+def _aggregator(reducer: Callable[..., Any] | Mapping[str, Callable[..., Any]]) -> tuple[Callable[[Any], Any], Callable[[Any, Any], Any], Callable[[Any], Any]]:
+    """Return functions starting accumulator from first element, combining it with next element and finishing it into result"""
+    if not isinstance(reducer, Mapping):
+        start, combine = _AGGREGATORS.get(reducer) or (_identity, _callable(reducer))
+        return start, combine, _identity
+    names = tuple(reducer)
+    starts, combines = builtins.zip(*(_aggregator(fn)[:2] for fn in reducer.values()))
+    def start(item: Any) -> list:
+        return [fn(item) for fn in starts]
+    def combine(acc: list, item: Any) -> list:
+        for i, fn in builtins.enumerate(combines):
+            acc[i] = fn(acc[i], item)
+        return acc
+    def finish(acc: list) -> dict[str, Any]:
+        return dict(builtins.zip(names, acc))
+    return start, combine, finish
+
+def _identity(value: Any) -> Any:
+    return value
+
+_AGGREGATORS = {
+    builtins.len: (lambda item: 1, lambda acc, item: acc + 1),
+    builtins.sum: (_identity, operator.add),
+    builtins.min: (_identity, lambda acc, item: item if item < acc else acc),
+    builtins.max: (_identity, lambda acc, item: item if item > acc else acc),
+}
+
+def _pruned_permutations(items: tuple, size: int, prune: Callable[[tuple], bool]) -> Iterable[tuple]:
+    def extend(prefix: tuple, remaining: tuple):
+        for i, item in builtins.enumerate(remaining):
+            candidate = prefix + (item,)
+            if prune(candidate):
+                continue
+            if len(candidate) == size:
+                yield candidate
+            else:
+                yield from extend(candidate, remaining[:i] + remaining[i + 1:])
+    if size == 0:
+        return iter([()])
+    return extend((), items) if size <= len(items) else iter(())
+
+def _pruned_combinations(items: tuple, size: int, prune: Callable[[tuple], bool]) -> Iterable[tuple]:
+    def extend(prefix: tuple, start: int):
+        for i in builtins.range(start, len(items) - size + len(prefix) + 1):
+            candidate = prefix + (items[i],)
+            if prune(candidate):
+                continue
+            if len(candidate) == size:
+                yield candidate
+            else:
+                yield from extend(candidate, i + 1)
+    if size == 0:
+        return iter([()])
+    return extend((), 0)
+
+def _pruned_product(pools: tuple[tuple, ...], prune: Callable[[tuple], bool]) -> Iterable[tuple]:
+    def extend(prefix: tuple):
+        for item in pools[len(prefix)]:
+            candidate = prefix + (item,)
+            if prune(candidate):
+                continue
+            if len(candidate) == len(pools):
+                yield candidate
+            else:
+                yield from extend(candidate)
+    if not pools:
+        return iter([()])
+    return extend(())
+
+def _pruned_subsets(items: tuple, prune: Callable[[tuple], bool]) -> Iterable[tuple]:
+    """Yield pruned combinations size by size, stopping at the first size without any"""
+    for size in builtins.range(len(items) + 1):
+        found = False
+        for combination in _pruned_combinations(items, size, prune):
+            found = True
+            yield combination
+        if not found:
+            return
+
+def _outside(item: Any, size: int) -> ValueError:
+    return ValueError(f'{item!r} is outside of bitmap range [ 0, {size} )')
+
+class _Ordered:
+    """Sort key comparing items with single call of `precedes` predicate per comparison"""
+    __slots__ = ('item', 'precedes')
+
+    def __init__(self, item: Any, precedes: Callable[[Any, Any], bool]) -> None:
+        self.item = item
+        self.precedes = precedes
+
+    def __lt__(self, other: Any) -> bool:
+        return self.precedes(self.item, other.item)
+
+def _select(items: list, index: int) -> Any:
+    """Return element at `index` of sorted `items` partitioning around median of three pivots"""
+    while True:
+        if len(items) <= 16:
+            return sorted(items)[index]
+        pivot = sorted((items[0], items[len(items) // 2], items[-1]))[1]
+        lower = [item for item in items if item < pivot]
+        if index < len(lower):
+            items = lower
+            continue
+        upper = [item for item in items if pivot < item]
+        if index >= len(items) - len(upper):
+            index -= len(items) - len(upper)
+            items = upper
+            continue
+        return pivot
+
+def _callable(fn: Callable[[Any], Any] | Mapping | None) -> Callable[[Any], Any] | None:
+    """Return the innermost callable for `fn` to avoid a wrapper call per element (None stays truthiness predicate)"""
+    if fn is None:
+        return None
+    if not callable(fn):
+        return fn.__getitem__
+    while isinstance(fn, (UnaryFn, BinaryFn)) and not isinstance(fn.fn, Pipeline):
+        fn = fn.fn
+    return fn
+
+def _arguments(fn: AnyFn) -> tuple[Callable[..., AnyFn] | None, dict[str, Any]]:
+    """Return factory of `fn` and its arguments bound to parameter names, or (None, {}) if unknown"""
+    if not isinstance(fn, UnaryFn) or fn.spec is None:
+        return None, {}
+    factory, args, kwargs = fn.spec
+    bound = inspect.signature(factory).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return factory, bound.arguments
+
+def _steps(factory: Callable[..., AnyFn] | None, args: dict[str, Any]) -> tuple[tuple[bool, Callable[[Any], Any]], ...] | None:
+    """Return `_chain` steps equivalent to an element-wise stage, or None if it is not one"""
+    if factory is map:
+        return ((False, args['mapper']),)
+    if factory is filter:
+        return ((True, args['predicate']),)
+    if factory is _chain:
+        return args['steps']
+    return None
+
+def _fuse_pair(lhs: AnyFn, rhs: AnyFn) -> AnyFn | None:
+    """Return single stage equivalent to `lhs | rhs`, or None if they cannot be fused"""
+    lhs_factory, lhs_args = _arguments(lhs)
+    rhs_factory, rhs_args = _arguments(rhs)
+
+    if lhs_factory is sort_by and rhs_factory is take and rhs_args['count'] is not None:
+        return _top(rhs_args['count'], lhs_args['key_fn'])
+
+    steps = _steps(lhs_factory, lhs_args)
+    if steps is None:
+        return None
+    if (rhs_steps := _steps(rhs_factory, rhs_args)) is not None:
+        return _chain(steps + rhs_steps)
+    if rhs_factory is sum:
+        return _chain_sum(steps, rhs_args['init'])
+    if rhs_factory is count_if:
+        return _chain_count_if(steps, rhs_args['predicate'])
+    if rhs_factory is min:
+        return _chain_extremum(steps, builtins.min)
+    if rhs_factory is max:
+        return _chain_extremum(steps, builtins.max)
+    return None
@@ -1,6 +1,13 @@
+import array
 from collections.abc import Iterable
+from typing import Any
 
-from ..classes import UnaryFn
+from ..classes import UnaryFn, stage
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 __all__ = [
     'join',
@@ -21,50 +28,81 @@ __all__ = [
     'is_lower',
     'is_digit',
     'is_ascii',
+    'ints',
+    'ints_per_line',
 ]
 
+@stage
 def join(connector: str) -> UnaryFn:
     """Concatenate iterable of strings with given `connector`"""
+    binary = _encoded(connector)
     def __inner(iterable: Iterable[str]) -> str:
-        return connector.join(iterable)
+        items = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        if items and not isinstance(items[0], str):
+            return binary.join(items)
+        return connector.join(items)
     return UnaryFn(__inner)
 
+@stage
 def trim(chars: str | None = None) -> UnaryFn:
     """Return string with leading and trailing characters (whitespace by default) removed"""
+    binary = _encoded(chars)
     def __inner(s: str) -> str:
-        return s.strip(chars)
+        if isinstance(s, str):
+            return s.strip(chars)
+        return _native(s).strip(binary)
     return UnaryFn(__inner)
 
+@stage
 def trim_left(chars: str | None = None) -> UnaryFn:
     """Return string with leading characters (whitespace by default) removed"""
+    binary = _encoded(chars)
     def __inner(s: str) -> str:
-        return s.lstrip(chars)
+        if isinstance(s, str):
+            return s.lstrip(chars)
+        return _native(s).lstrip(binary)
     return UnaryFn(__inner)
 
+@stage
 def trim_right(chars: str | None = None) -> UnaryFn:
     """Return string with trailing characters (whitespace by default) removed"""
+    binary = _encoded(chars)
     def __inner(s: str) -> str:
-        return s.rstrip(chars)
+        if isinstance(s, str):
+            return s.rstrip(chars)
+        return _native(s).rstrip(binary)
     return UnaryFn(__inner)
 
+@stage
 def split(limit: int = -1) -> UnaryFn:
     """Return substrings of the string split by whitespaces up to the `limit` without empty splits"""
     def __inner(s: str) -> list[str]:
-        return s.split(None, limit)
+        if isinstance(s, str):
+            return s.split(None, limit)
+        return _native(s).split(None, limit)
     return UnaryFn(__inner)
 
+@stage
 def split_by(separator: str, limit: int = -1) -> UnaryFn:
     """Return substrings of the string split by `separator` up to the `limit`"""
+    binary = _encoded(separator)
     def __inner(s: str) -> list[str]:
-        return s.split(separator, limit)
+        if isinstance(s, str):
+            return s.split(separator, limit)
+        return _native(s).split(binary, limit)
     return UnaryFn(__inner)
 
+@stage
 def replace(old: str, new: str, count: int = -1) -> UnaryFn:
     """Return string with occurrences of substring `old` replaced by `new` up to `count` times"""
+    binary_old, binary_new = _encoded(old), _encoded(new)
     def __inner(s: str) -> str:
-        return s.replace(old, new, count)
+        if isinstance(s, str):
+            return s.replace(old, new, count)
+        return _native(s).replace(binary_old, binary_new, count)
     return UnaryFn(__inner)
 
+@stage
 def substring(position: int, size: int | None = None) -> UnaryFn:
     """Return substring starting at `position` with given `size` (or to the end if None)"""
     def __inner(s: str) -> str:
@@ -73,62 +111,161 @@ def substring(position: int, size: int | None = None) -> UnaryFn:
         return s[position:position + size]
     return UnaryFn(__inner)
 
+@stage
 def contains(sub: str) -> UnaryFn:
     """Check whether string contains given substring `sub`"""
+    binary = _encoded(sub)
     def __inner(s: str) -> bool:
-        return sub in s
+        if isinstance(s, str):
+            return sub in s
+        return binary in _native(s)
     return UnaryFn(__inner)
 
+@stage
 def starts_with(prefix: str | tuple[str, ...]) -> UnaryFn:
     """Check whether string starts with given `prefix` (or tuple of prefixes)"""
+    binary = _encoded(prefix)
     def __inner(s: str) -> bool:
-        return s.startswith(prefix)
+        if isinstance(s, str):
+            return s.startswith(prefix)
+        return _native(s).startswith(binary)
     return UnaryFn(__inner)
 
+@stage
 def ends_with(suffix: str | tuple[str, ...]) -> UnaryFn:
     """Check whether string ends with given `suffix` (or tuple of suffixes)"""
+    binary = _encoded(suffix)
     def __inner(s: str) -> bool:
-        return s.endswith(suffix)
+        if isinstance(s, str):
+            return s.endswith(suffix)
+        return _native(s).endswith(binary)
     return UnaryFn(__inner)
 
+@stage
 def is_space() -> UnaryFn:
     """Check whether string is composed of whitespace characters"""
     def __inner(s: str) -> bool:
-        return s.isspace()
+        if isinstance(s, str):
+            return s.isspace()
+        return _native(s).isspace()
     return UnaryFn(__inner)
 
+@stage
 def is_alnum() -> UnaryFn:
     """Check whether string is composed of alphanumeric characters"""
     def __inner(s: str) -> bool:
-        return s.isalnum()
+        if isinstance(s, str):
+            return s.isalnum()
+        return _native(s).isalnum()
     return UnaryFn(__inner)
 
+@stage
 def is_alpha() -> UnaryFn:
     """Check whether string is composed of alpha characters"""
     def __inner(s: str) -> bool:
-        return s.isalpha()
+        if isinstance(s, str):
+            return s.isalpha()
+        return _native(s).isalpha()
     return UnaryFn(__inner)
 
+@stage
 def is_upper() -> UnaryFn:
     """Check whether string is composed of uppercase characters"""
     def __inner(s: str) -> bool:
-        return s.isupper()
+        if isinstance(s, str):
+            return s.isupper()
+        return _native(s).isupper()
     return UnaryFn(__inner)
 
+@stage
 def is_lower() -> UnaryFn:
     """Check whether string is composed of lowercase characters"""
     def __inner(s: str) -> bool:
-        return s.islower()
+        if isinstance(s, str):
+            return s.islower()
+        return _native(s).islower()
     return UnaryFn(__inner)
 
+@stage
 def is_digit() -> UnaryFn:
     """Check whether string is composed of digit characters"""
     def __inner(s: str) -> bool:
-        return s.isdigit()
+        if isinstance(s, str):
+            return s.isdigit()
+        return _native(s).isdigit()
     return UnaryFn(__inner)
 
+@stage
 def is_ascii() -> UnaryFn:
     """Check whether string is composed of ascii characters"""
     def __inner(s: str) -> bool:
-        return s.isascii()
+        if isinstance(s, str):
+            return s.isascii()
+        return _native(s).isascii()
+    return UnaryFn(__inner)
+
+@stage
+def ints(signed: bool = True, into: str = 'list') -> UnaryFn:
+    """Return all integers of ASCII digits found in the string as list, `array('q')` or NumPy array"""
+    convert = _collector(into)
+    def __inner(s: str) -> Any:
+        return convert(_numbers(s, signed).split())
     return UnaryFn(__inner)
+
+@stage
+def ints_per_line(signed: bool = True, into: str = 'list') -> UnaryFn:
+    """Return integers found in each line of the string, split like `str.splitlines` (see `ints`)"""
+    convert = _collector(into)
+    def __inner(s: str) -> list[Any]:
+        lines = s.splitlines() if isinstance(s, str) else _native(s).splitlines()
+        return [convert(_numbers(line, signed).split()) for line in lines]
+    return UnaryFn(__inner)
+
+class _Blanks(dict):
+    """Translation table mapping every character not explicitly kept to space"""
+    __slots__ = ()
+
+    def __missing__(self, key: int) -> int:
+        self[key] = 32
+        return 32
+
+def _numbers_table(kept: str) -> tuple[_Blanks, bytes]:
+    binary = bytes(byte if chr(byte) in kept else 32 for byte in range(256))
+    return _Blanks({ord(char): ord(char) for char in kept}), binary
+
+_NUMBERS_TABLES = {signed: _numbers_table('0123456789' + '-' * signed) for signed in (False, True)}
+
+def _numbers(s: Any, signed: bool) -> Any:
+    """Return string with everything but integers of ASCII digits blanked, ready to be split into integer tokens"""
+    text, binary = _NUMBERS_TABLES[signed]
+    if isinstance(s, str):
+        s, blank, minus = s.translate(text), ' ', '-'
+    else:
+        s, blank, minus = _native(s).translate(binary), b' ', b'-'
+    if not signed:
+        return s
+    return (s + blank).replace(minus, blank + minus).replace(minus + blank, blank)
+
+def _collector(into: str) -> Any:
+    """Return function converting list of integer tokens into collection of kind `into`"""
+    if into == 'list':
+        return lambda tokens: list(map(int, tokens))
+    if into == 'array':
+        return lambda tokens: array.array('q', map(int, tokens))
+    if into == 'numpy':
+        if numpy is None:
+            raise ModuleNotFoundError('ints into numpy requires NumPy to be installed')
+        return lambda tokens: numpy.fromiter(map(int, tokens), numpy.int64, len(tokens))
+    raise ValueError(f'Unsupported integers collection {into!r}')
+
+def _encoded(value: Any) -> Any:
+    """Return string `value` (or tuple of strings) encoded for use with bytes-like strings"""
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, tuple):
+        return tuple(_encoded(item) for item in value)
+    return value
+
+def _native(s: Any) -> bytes | bytearray:
+    """Return bytes-like `s` (e.g. memoryview of memory mapped file) as object with bytes methods"""
+    return s if isinstance(s, (bytes, bytearray)) else bytes(s)
@@ -10,4 +10,7 @@ if __name__ == '__main__':
         author = 'Patrick Stritch',
         url = 'https://github.com/MetGang/advent',
         packages = find_packages(),
+        extras_require = {
+            'numpy': ['numpy'],
+        },
     )
@@ -0,0 +1,27 @@
+import pickle
+
+import pytest
+
+from advent import op, sq
+
+@pytest.mark.parametrize('pipeline, data', [
+    (sq.map(bytes.upper) | sq.sum(b''), [b'a', b'b']),
+    (sq.map(str.upper) | sq.sum(''), ['a', 'b']),
+    (sq.map(list) | sq.sum([]), ['ab', 'c']),
+    (sq.map(op.inc) | sq.filter(op.even) | sq.sum(), [1, 2, 3]),
+    (sq.filter(None) | sq.map(str), [0, 1, '', 2]),
+])
+def test_fuse_never_changes_results(pipeline, data):
+    expected = _collected(pipeline(data))
+    fused = sq.fuse(pipeline)
+    assert fused is not pipeline
+    assert _collected(fused(data)) == expected
+    assert _collected(pickle.loads(pickle.dumps(fused))(data)) == expected
+
+def test_fuse_folds_already_fused_stages():
+    fused = sq.fuse(sq.fuse(sq.map(op.inc) | sq.filter(op.even)) | sq.sum())
+    assert 'sequences._chain_sum' in repr(fused)
+    assert fused([1, 2, 3]) == 6
+
+def _collected(result):
+    return result if isinstance(result, (int, str, bytes, list)) else list(result)
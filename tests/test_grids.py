@@ -0,0 +1,15 @@
+from advent import gd
+from advent.modules.grids import Grid
+
+
+def test_str_renders_text_grid_as_text():
+    assert str(gd.parse_grid()('#.\n.#')) == '#.\n.#'
+
+
+def test_str_renders_digit_grid_as_digits():
+    assert str(gd.parse_grid(True)('12\n34')) == '12\n34'
+    assert str(Grid.filled(2, 2)) == '00\n00'
+
+
+def test_str_renders_other_values_as_numbers():
+    assert str(gd.to_grid(2)([1, 200, 3, 4])) == '1 200\n3 4'
@@ -0,0 +1,28 @@
+import threading
+
+from advent import fn, gn, sq
+
+LIMIT = 0
+
+def helper(x):
+    return x > LIMIT
+
+def test_persist_misses_when_global_read_by_function_changes(tmp_path, monkeypatch):
+    keep = lambda x: helper(x)
+    solver = fn.persist(gn.iterate([1, 5, 9]) | sq.filter(keep) | list, tmp_path / 'cache.sqlite')
+    assert solver() == [1, 5, 9]
+    monkeypatch.setitem(globals(), 'LIMIT', 6)
+    assert solver() == [9]
+
+def test_persist_misses_when_bound_method_receiver_changes(tmp_path):
+    table = {1: 'a'}
+    solver = fn.persist(gn.iterate([1]) | sq.map(table.get) | list, tmp_path / 'cache.sqlite')
+    assert solver() == ['a']
+    table[1] = 'b'
+    assert solver() == ['b']
+
+def test_persist_skips_caching_unfingerprintable_values(tmp_path):
+    lock, calls = threading.Lock(), []
+    solver = fn.persist(gn.iterate([1]) | sq.map(lambda x: calls.append(lock) or x) | list, tmp_path / 'cache.sqlite')
+    assert solver() == solver() == [1]
+    assert len(calls) == 2
@@ -0,0 +1,26 @@
+import pytest
+
+from advent import gs
+
+DIRECTED = {0: [1, 2], 1: [3], 2: [3], 3: []}
+
+def _predecessors(graph):
+    reverse = {state: [] for state in graph}
+    for state, following in graph.items():
+        for neighbour in following:
+            reverse[neighbour].append(state)
+    return reverse
+
+def test_bidirectional_finds_shortest_path_in_directed_graph():
+    path = gs.bidirectional(DIRECTED, 3, _predecessors(DIRECTED))(0)
+    assert path in ([0, 1, 3], [0, 2, 3])
+    assert len(path) - 1 == dict(gs.bfs(DIRECTED)(0))[3]
+
+def test_bidirectional_requires_predecessors_unless_undirected():
+    with pytest.raises(ValueError):
+        gs.bidirectional(DIRECTED, 3)
+    undirected = {0: [1], 1: [0, 2], 2: [1]}
+    assert gs.bidirectional(undirected, 2, undirected=True)(0) == [0, 1, 2]
+
+def test_bidirectional_returns_none_when_goal_unreachable():
+    assert gs.bidirectional(DIRECTED, 0, _predecessors(DIRECTED))(3) is None
@@ -0,0 +1,30 @@
+import math
+
+import pytest
+
+from advent.classes import BloomFilter, HyperLogLog
+
+KEYS = {
+    'ints': lambda n: range(n),
+    'strided': lambda n: range(0, 97 * n, 97),
+    'tuples': lambda n: ((i, 7 * i) for i in range(n)),
+}
+
+@pytest.mark.parametrize('precision', [10, 14])
+@pytest.mark.parametrize('keys', KEYS)
+def test_hyperloglog_error_within_three_standard_errors(precision, keys):
+    sketch, n = HyperLogLog(precision), 100_000
+    for key in KEYS[keys](n):
+        sketch.add(key)
+    assert abs(len(sketch) / n - 1) < 3 * 1.04 / math.sqrt(1 << precision)
+
+@pytest.mark.parametrize('error_rate', [0.01, 0.001])
+@pytest.mark.parametrize('keys', KEYS)
+def test_bloom_filter_false_positive_rate(error_rate, keys):
+    sketch, n = BloomFilter(50_000, error_rate), 50_000
+    for key in KEYS[keys](n):
+        sketch.add(key)
+    assert all(key in sketch for key in KEYS[keys](n))
+    probes = 200_000
+    false_positives = sum((key, 'absent') in sketch for key in range(probes))
+    assert false_positives / probes < 1.5 * error_rate
@@ -0,0 +1,19 @@
+import math
+import random
+
+import pytest
+
+from advent import sq
+
+@pytest.mark.parametrize('data, expected', [
+    ([1e300, 1e300, 1.0, 1.0], [math.inf, 1e300, 1.0]),
+    ([1e-200, 1e-200, 1.0, 1.0], [0.0, 1e-200, 1.0]),
+])
+def test_sliding_product_recovers_after_overflow_and_underflow(data, expected):
+    assert list(sq.sliding_product(2)(data)) == expected
+
+@pytest.mark.parametrize('size', [1, 2, 3, 5])
+def test_sliding_product_matches_window_products(size):
+    rng = random.Random(size)
+    data = [rng.randint(-3, 3) for _ in range(50)]
+    assert list(sq.sliding_product(size)(data)) == [math.prod(data[i:i + size]) for i in range(len(data) - size + 1)]
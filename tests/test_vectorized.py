@@ -0,0 +1,33 @@
+import builtins
+
+import pytest
+
+from advent import op, sq
+
+numpy = pytest.importorskip('numpy')
+
+@pytest.mark.parametrize('reducer', [op.idiv, op.mod, op.div])
+def test_reduce_by_zero_raises_like_python(reducer):
+    with pytest.raises(ZeroDivisionError):
+        sq.reduce(reducer)([7, 0])
+    with pytest.raises(ZeroDivisionError):
+        sq.reduce(reducer)(numpy.array([7, 0]))
+
+def test_map_division_by_zero_raises_like_python():
+    with pytest.raises(ZeroDivisionError):
+        sq.map(op.div.right(0))(numpy.array([1.0, 2.0]))
+    assert list(sq.map(op.idiv.right(2))(numpy.array([7, -7]))) == [3, -4]
+
+@pytest.mark.parametrize('fn', [op.floor, op.ceil, op.sign])
+def test_rounding_and_sign_return_ints_like_python(fn):
+    data = [1.5, -2.5, 0.0]
+    result = list(sq.map(fn)(numpy.array(data)))
+    assert result == list(map(fn, data))
+    assert all(isinstance(value, (int, numpy.integer)) for value in result)
+
+def test_reduce_with_float_init_promotes_like_python():
+    assert sq.reduce(op.add, 0.5)(numpy.arange(3)) == 3.5
+
+def test_sum_does_not_wrap_around():
+    data = [2 ** 62] * 3
+    assert sq.sum()(numpy.array(data, dtype=numpy.int64)) == builtins.sum(data)